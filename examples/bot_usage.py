@@ -5,6 +5,7 @@ import asyncio
 import logging
 from datetime import datetime
 from triangular_arbitrage.core.bot_core import BotCore
+from triangular_arbitrage.core.event_loop import configure_event_loop
 from triangular_arbitrage.config import TRADING_CONFIG
 
 # Configuração de logging
@@ -73,6 +74,7 @@ async def main():
         logger.info("Modo de produção ignorado")
 
 if __name__ == "__main__":
+    configure_event_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -7,6 +7,7 @@ import logging
 from dotenv import load_dotenv  # Corrigido: importação correta do python-dotenv
 
 from triangular_arbitrage.core.bot_core import BotCore
+from triangular_arbitrage.core.event_loop import configure_event_loop
 from triangular_arbitrage.core.ai_pair_finder import AIPairFinder
 from triangular_arbitrage.ui.web.app import WebDashboard
 from triangular_arbitrage.utils.error_handler import error_tracker
@@ -136,8 +137,7 @@ async def main():
         os._exit(0)
 
 if __name__ == "__main__":
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    configure_event_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -8,11 +8,14 @@ from decimal import Decimal
 import time
 from datetime import datetime
 
+import numpy as np
+
 from .openrouter_ai import OpenRouterAI
 from ..storage.vector_store import VectorStore
 from triangular_arbitrage.utils.log_config import setup_logging
 from ..binance_init import AsyncClient, BinanceAPIException
 from ..metrics_manager import metrics_manager
+from .. import kernels
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +44,20 @@ class ArbitrageAgent:
         self.min_volume = Decimal('100000')  # Volume mínimo em USDT
         self.max_volatility = Decimal('5.0')  # Máxima volatilidade em %
         self.min_order_book_depth = Decimal('50000')  # Profundidade mínima
+
+        # Índice prefixo -> [(símbolo, restante)] para fechar triângulos sem
+        # testar todos os pares; refeito só quando o conjunto de símbolos muda
+        self._indexed_symbols: frozenset = frozenset()
+        self._pairs_by_prefix: Dict[str, List[Tuple[str, str]]] = {}
         
         # Setup inicial
         self._setup_logging()
         self._setup_ai(model_name)
         
+    def close(self):
+        """Encerra o agente, fechando a sessão HTTP do OpenRouter"""
+        self.ai.close()
+
     def _setup_logging(self):
         """Configura logging específico para o agente"""
         self.loggers = setup_logging("arbitrage_agent")
@@ -86,6 +98,18 @@ class ArbitrageAgent:
             result[base] = pairs
             
         return result
+
+    def _index_symbols(self, prices: Dict):
+        """Indexa cada símbolo por todos os seus prefixos (ex.: 'ETH' -> ('ETHUSDT', 'USDT'))"""
+        if self._indexed_symbols == prices.keys():
+            return
+
+        index: Dict[str, List[Tuple[str, str]]] = {}
+        for symbol in prices:
+            for cut in range(1, len(symbol)):
+                index.setdefault(symbol[:cut], []).append((symbol, symbol[cut:]))
+        self._pairs_by_prefix = index
+        self._indexed_symbols = frozenset(prices)
         
     async def detect_opportunities(self, prices: Dict, volumes: Dict, order_books: Dict) -> List[Dict]:
         """
@@ -107,34 +131,65 @@ class ArbitrageAgent:
         try:
             # Filtra e prioriza pares
             filtered_pairs = self._filter_pairs(prices, volumes)
-            
+            self._index_symbols(prices)
+            pairs_by_prefix = self._pairs_by_prefix
+
+            # Enumera os triângulos; o lucro é calculado em lote logo abaixo
+            legs: List[Tuple[str, str, str, str]] = []
+            leg_prices: List[Tuple] = []
             for base, pairs in filtered_pairs.items():
+                # Pares filtrados terminam com a base: moeda -> (par, preço)
+                cut = len(base)
+                by_asset = {pair[:-cut]: (pair, price) for pair, price in pairs}
+
                 for pair_a, price_a in pairs:
-                    for pair_b, price_b in pairs:
-                        if pair_a != pair_b:
-                            # Verifica se existe par C que fecha o triângulo
-                            symbol_a = pair_a.replace(base, '')
-                            symbol_b = pair_b.replace(base, '')
-                            pair_c = f"{symbol_a}{symbol_b}"
-                            
-                            if pair_c in prices:
-                                # Verifica liquidez e profundidade
-                                if not self._check_liquidity(
-                                    order_books.get(pair_a, {}),
-                                    order_books.get(pair_b, {}),
-                                    order_books.get(pair_c, {})
-                                ):
-                                    continue
-                                
-                                opportunity = self._calculate_opportunity(
-                                    pair_a, pair_b, pair_c,
-                                    price_a, price_b, prices[pair_c],
-                                    base,
-                                    volumes
-                                )
-                                
-                                if opportunity and self._validate_opportunity(opportunity):
-                                    opportunities.append(opportunity)
+                    # Pares C que começam com a moeda de A e terminam com a moeda de B
+                    for pair_c, symbol_b in pairs_by_prefix.get(pair_a[:-cut], ()):
+                        leg_b = by_asset.get(symbol_b)
+                        if leg_b is None or leg_b[0] == pair_a:
+                            continue
+                        pair_b, price_b = leg_b
+                        legs.append((pair_a, pair_b, pair_c, base))
+                        leg_prices.append((price_a, price_b, prices[pair_c]))
+
+            if legs:
+                # Lucro de todos os triângulos em float64: (1/A) * B * (1/C) - 1
+                px = np.array(leg_prices, dtype=np.float64)
+                min_profit = float(self.min_profit)
+                if kernels.NUMBA_AVAILABLE:
+                    hits = np.empty(px.shape[0], dtype=np.int64)
+                    profit = np.empty(px.shape[0], dtype=np.float64)
+                    count = kernels.scan_price_triangles(px, min_profit, hits, profit)
+                    hits = hits[:count]
+                else:
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        profit = (px[:, 1] / (px[:, 0] * px[:, 2]) - 1.0) * 100.0
+                    valid = (px[:, 0] > 0) & (px[:, 2] > 0)
+                    hits = np.flatnonzero(valid & (profit > min_profit))
+
+                # Só os triângulos lucrativos passam pela liquidez e viram dicts
+                for i in hits.tolist():
+                    pair_a, pair_b, pair_c, base = legs[i]
+
+                    # Verifica liquidez e profundidade
+                    if not self._check_liquidity(
+                        order_books.get(pair_a, {}),
+                        order_books.get(pair_b, {}),
+                        order_books.get(pair_c, {})
+                    ):
+                        continue
+
+                    price_a, price_b, price_c = px[i].tolist()
+                    opportunity = self._build_opportunity(
+                        pair_a, pair_b, pair_c,
+                        price_a, price_b, price_c,
+                        base,
+                        volumes,
+                        float(profit[i])
+                    )
+                    
+                    if self._validate_opportunity(opportunity):
+                        opportunities.append(opportunity)
                                     
             # Ordena por lucro potencial
             opportunities.sort(key=lambda x: x['profit_percentage'], reverse=True)
@@ -185,36 +240,53 @@ class ArbitrageAgent:
             profit_percentage = (rate - Decimal('1')) * Decimal('100')
             
             if profit_percentage > self.min_profit:
-                min_volume = min(
-                    volumes.get(pair_a, 0),
-                    volumes.get(pair_b, 0),
-                    volumes.get(pair_c, 0)
+                return self._build_opportunity(
+                    pair_a, pair_b, pair_c,
+                    price_a, price_b, price_c,
+                    base,
+                    volumes,
+                    float(profit_percentage)
                 )
                 
-                return {
-                    'pairs': [pair_a, pair_b, pair_c],
-                    'base': base,
-                    'prices': {
-                        pair_a: float(price_a),
-                        pair_b: float(price_b),
-                        pair_c: float(price_c)
-                    },
-                    'volumes': {
-                        pair_a: volumes.get(pair_a, 0),
-                        pair_b: volumes.get(pair_b, 0),
-                        pair_c: volumes.get(pair_c, 0)
-                    },
-                    'profit_percentage': float(profit_percentage),
-                    'volume_24h': float(min_volume),
-                    'timestamp': datetime.now().timestamp(),
-                    'path': f"{pair_a} → {pair_b} → {pair_c}"
-                }
-                
             return None
             
         except Exception as e:
             logger.error(f"Erro ao calcular oportunidade: {e}")
             return None
+
+    def _build_opportunity(self,
+                           pair_a: str,
+                           pair_b: str,
+                           pair_c: str,
+                           price_a: float,
+                           price_b: float,
+                           price_c: float,
+                           base: str,
+                           volumes: Dict,
+                           profit_percentage: float) -> Dict:
+        """Monta o dict da oportunidade a partir do lucro já calculado"""
+        volume_a = volumes.get(pair_a, 0)
+        volume_b = volumes.get(pair_b, 0)
+        volume_c = volumes.get(pair_c, 0)
+
+        return {
+            'pairs': [pair_a, pair_b, pair_c],
+            'base': base,
+            'prices': {
+                pair_a: float(price_a),
+                pair_b: float(price_b),
+                pair_c: float(price_c)
+            },
+            'volumes': {
+                pair_a: volume_a,
+                pair_b: volume_b,
+                pair_c: volume_c
+            },
+            'profit_percentage': profit_percentage,
+            'volume_24h': float(min(volume_a, volume_b, volume_c)),
+            'timestamp': datetime.now().timestamp(),
+            'path': f"{pair_a} → {pair_b} → {pair_c}"
+        }
             
     def _validate_opportunity(self, opportunity: Dict) -> bool:
         """Valida se uma oportunidade atende os critérios mínimos"""
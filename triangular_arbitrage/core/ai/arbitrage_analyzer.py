@@ -3,6 +3,7 @@ Analisador de oportunidades de arbitragem usando IA
 """
 from typing import Dict, List, Optional
 import logging
+from collections import deque
 from datetime import datetime
 from decimal import Decimal
 import asyncio
@@ -24,7 +25,7 @@ class ArbitrageAnalyzer:
         self.cache_ttl = AI_CONFIG.get('analysis_cache_ttl', 500)  # 500ms default
         
         # Histórico de operações
-        self.operation_history = []
+        self.operation_history = deque(maxlen=1000)  # Mantém apenas últimas 1000 operações
         
     @handle_errors(retries=2, delay=0.5)
     async def analyze_opportunity(self, opportunity: Dict) -> Dict:
@@ -156,8 +157,4 @@ class ArbitrageAnalyzer:
             'timestamp': datetime.now().isoformat()
         }
 
-        self.operation_history.append(operation)
-        
-        # Mantém apenas últimas 1000 operações
-        if len(self.operation_history) > 1000:
-            self.operation_history = self.operation_history[-1000:]
\ No newline at end of file
+        self.operation_history.append(operation)
\ No newline at end of file
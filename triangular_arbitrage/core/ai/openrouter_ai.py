@@ -5,13 +5,14 @@ from .base_ai import BaseAI
 from typing import Dict, Optional, List
 import logging
 import requests
+import orjson
 import time
 import os
-from tenacity import retry, stop_after_attempt, wait_exponential
 from limits import strategies, parse
 from limits.storage import MemoryStorage
 from functools import wraps
 from ..metrics_manager import metrics_manager
+from ...utils.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,14 @@ class CostTracker:
 
 cost_tracker = CostTracker(TOTAL_COST_BUDGET)
 
+# Circuit breaker: após 5 falhas consecutivas, falha rápido por 30s sem tocar a rede
+openrouter_circuit = CircuitBreaker(
+    failure_threshold=5,
+    recovery_timeout=30.0,
+    half_open_timeout=30.0,
+    name="openrouter"
+)
+
 def ratelimit():
     def decorator(func):
         @wraps(func)
@@ -76,6 +85,9 @@ class OpenRouterAI(BaseAI):
         self.base_url = "https://openrouter.ai/api/v1"
         self.response_cache = {}  # Cache de respostas
         
+        # Sessão HTTP persistente (keep-alive)
+        self._session = requests.Session()
+        
     def setup(self, config: Dict) -> bool:
         try:
             self.config = config
@@ -91,7 +103,7 @@ class OpenRouterAI(BaseAI):
                 "Content-Type": "application/json"
             }
             
-            response = requests.get(f"{self.base_url}/models", headers=headers)
+            response = self._session.get(f"{self.base_url}/models", headers=headers)
             if response.status_code == 200:
                 self.is_connected = True
                 self.is_ready = True
@@ -107,7 +119,6 @@ class OpenRouterAI(BaseAI):
             self.is_ready = False
             return False
             
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     @ratelimit()
     def analyze(self, data: Dict) -> Dict:
         start_time = metrics_manager.start_analysis()
@@ -124,6 +135,11 @@ class OpenRouterAI(BaseAI):
             else:
                 logger.debug("Cache expirado. Requisitando nova análise.")
         
+        if not openrouter_circuit.allow_request():
+            logger.debug("Circuit OpenRouter aberto. Ignorando análise.")
+            metrics_manager.end_analysis(start_time, False, cost)
+            return {"error": "circuit_open"}
+        
         try:
             if not self.is_connected:
                 self.logger.error("OpenRouter não está conectado")
@@ -150,14 +166,15 @@ class OpenRouterAI(BaseAI):
                 ]
             }
             
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
                 headers=headers,
                 json=payload
             )
             
             if response.status_code == 200:
-                result = response.json()
+                # orjson lê os bytes diretamente, sem decodificar .text
+                result = orjson.loads(response.content)
                 
                 # Calcula o custo da análise (estimativa)
                 input_tokens = len(str(data)) / 4  # Aproximação
@@ -175,18 +192,19 @@ class OpenRouterAI(BaseAI):
                     logger.debug("Resposta armazenada no cache")
                 
                 success = True
+                openrouter_circuit.record_success()
                 metrics_manager.end_analysis(start_time, True, cost)
                 return {
                     "status": "success",
                     "analysis": result['choices'][0]['message']['content']
                 }
             else:
-                self.logger.error(f"Erro na análise: {response.text}")
-                metrics_manager.end_analysis(start_time, False, cost)
+                # Registro da falha (circuito e métricas) feito uma única vez no except
                 raise Exception(f"Falha na análise: {response.text}")
                 
         except Exception as e:
             self.logger.error(f"Erro ao analisar dados: {e}")
+            openrouter_circuit.record_failure(e)
             metrics_manager.end_analysis(start_time, False, cost)
             return {"error": str(e)}
             
@@ -202,7 +220,13 @@ class OpenRouterAI(BaseAI):
         """Valida limites de taxa do OpenRouter"""
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = requests.get(f"{self.base_url}/limits", headers=headers)
+            response = self._session.get(f"{self.base_url}/limits", headers=headers)
             return response.status_code == 200
         except:
             return False
+
+    def close(self):
+        """Fecha a sessão HTTP persistente e libera as conexões do pool"""
+        self._session.close()
+        self.is_connected = False
+        self.is_ready = False
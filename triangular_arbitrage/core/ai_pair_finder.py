@@ -1,17 +1,17 @@
 import logging
+import os
 import time
-from typing import List, Dict, Optional, Any, Union, TYPE_CHECKING
+from typing import List, Dict, Optional, Any, Union, Tuple, TYPE_CHECKING
 import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
-import numpy as np
-from transformers import pipeline
-from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 if TYPE_CHECKING:
     from ..ui.display import Display
+    import numpy as np
+    from binance import AsyncClient
 from ..config import BINANCE_CONFIG
-from binance import AsyncClient, BinanceSocketManager
-from binance.exceptions import BinanceAPIException
 from ..utils.error_handler import handle_errors, APIError, ValidationError, error_tracker
 from ..utils.debug_logger import debug_logger
 from ..utils.circuit_breaker import circuit_breaker, api_circuit
@@ -19,14 +19,57 @@ from ..utils.performance_metrics import metrics_manager
 
 logger = logging.getLogger(__name__)
 
+SENTIMENT_MODEL = "finiteautomata/bertweet-base-sentiment-analysis"
+# Modelo ONNX quantizado em INT8, exportado uma única vez e reutilizado
+SENTIMENT_ONNX_DIR = Path(os.path.expanduser("~/.cache/arb/sentiment-int8"))
+
+# Peso das requisições REST na Binance (limite de 6000 por minuto por IP); a varredura
+# de pares usa só metade do limite para deixar folga ao restante do bot
+REQUEST_WEIGHT_PER_MINUTE = 3000
+TICKER_24H_ALL_WEIGHT = 80  # /api/v3/ticker/24hr sem símbolo
+ORDER_BOOK_WEIGHT = 5  # /api/v3/depth com limit <= 100
+MAX_CONCURRENT_REQUESTS = 10
+
+
+class _WeightBucket:
+    """Token bucket por peso de requisição: espera até haver peso disponível"""
+
+    def __init__(self, weight_per_minute: float, capacity: float):
+        self.rate = weight_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        # Criado sob demanda para pertencer ao event loop em execução
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, weight: float):
+        """Consome weight do bucket, aguardando a reposição se necessário"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                await asyncio.sleep((weight - self.tokens) / self.rate)
+
+
 class AIPairFinder:
     def __init__(self, config: Optional[Dict] = None):
         operation_id = debug_logger.start_operation('init_ai_pair_finder', {'config': config})
         
         try:
+            import numpy as np
+
             self.config = config or {}
             self.logger = logging.getLogger(__name__)
-            self.client = None
+            self.client: Optional['AsyncClient'] = None
+            self._client_lock: Optional[asyncio.Lock] = None
+            # Ritmo das requisições REST pelo peso da Binance (evita 429/418)
+            self._weight_bucket = _WeightBucket(REQUEST_WEIGHT_PER_MINUTE, capacity=TICKER_24H_ALL_WEIGHT * 2)
             
             # Cache de resultados para reduzir chamadas à API
             self.cache = {}
@@ -46,16 +89,44 @@ class AIPairFinder:
                     'Iniciando carregamento do modelo de sentimento'
                 )
                 
-                self.sentiment_analyzer = pipeline(
-                    "sentiment-analysis",
-                    model="finiteautomata/bertweet-base-sentiment-analysis",
-                    max_length=512
-                )
+                # Importação tardia: torch/transformers só são carregados quando usados
+                os.environ.setdefault('TRANSFORMERS_NO_ADVISORY_WARNINGS', '1')
+                os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+                import torch
+                from transformers import pipeline
+
+                # GPU: FP16 via torch; CPU: INT8 via ONNX Runtime quando disponível
+                if torch.cuda.is_available():
+                    self.sentiment_analyzer = pipeline(
+                        "sentiment-analysis",
+                        model=SENTIMENT_MODEL,
+                        max_length=512,
+                        device=0,
+                        torch_dtype=torch.float16
+                    )
+                    model_variant = 'fp16-cuda'
+                else:
+                    try:
+                        self.sentiment_analyzer = self._load_onnx_sentiment_pipeline(pipeline)
+                        model_variant = 'int8-onnx'
+                    except Exception as e:
+                        # optimum ausente ou falha na exportação: usa o modelo FP32 padrão
+                        debug_logger.log_event(
+                            'sentiment_onnx_unavailable',
+                            'Modelo ONNX INT8 indisponível, usando FP32',
+                            {'error': str(e)}
+                        )
+                        self.sentiment_analyzer = pipeline(
+                            "sentiment-analysis",
+                            model=SENTIMENT_MODEL,
+                            max_length=512
+                        )
+                        model_variant = 'fp32'
                 
                 debug_logger.log_event(
                     'sentiment_model_loaded',
                     'Modelo de sentimento carregado com sucesso',
-                    {'model': 'bertweet-base-sentiment-analysis'}
+                    {'model': 'bertweet-base-sentiment-analysis', 'variant': model_variant}
                 )
                 
             except Exception as e:
@@ -67,6 +138,10 @@ class AIPairFinder:
                 )
                 self.sentiment_analyzer = None
 
+            # Compila os kernels Numba de scoring antes do primeiro uso
+            from . import kernels
+            kernels.warmup()
+
             # Lista base de pares mais comuns
             self.base_pairs = BINANCE_CONFIG['quote_assets']
             debug_logger.log_event(
@@ -75,8 +150,18 @@ class AIPairFinder:
                 {'pairs': self.base_pairs}
             )
             
-            # Histórico de performance
-            self.performance_history = []
+            # Cache de sentimento por símbolo: evita reprocessar o modelo a cada atualização
+            self._sent_cache: 'OrderedDict[str, Tuple[float, Dict]]' = OrderedDict()
+            self._sent_cache_ttl = 3600  # 1 hora
+            self._sent_cache_max_size = 10000
+
+            # Histórico de performance: ring buffer de arrays NumPy (últimos 1000 registros)
+            self._perf_size = 1000
+            self._perf_prof = np.zeros(self._perf_size, dtype=bool)
+            self._perf_pair = np.empty(self._perf_size, dtype='U20')
+            self._perf_ts = np.zeros(self._perf_size, dtype=np.float64)  # epoch, formatado só na leitura
+            self._perf_n = 0
+            self._perf_pos = 0
             debug_logger.end_operation(operation_id, 'success')
             
         except Exception as e:
@@ -87,6 +172,34 @@ class AIPairFinder:
             )
             raise
 
+    def _load_onnx_sentiment_pipeline(self, pipeline):
+        """Carrega o modelo de sentimento quantizado (INT8 dinâmico) no ONNX Runtime"""
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        quantized_file = "model_quantized.onnx"
+        if not (SENTIMENT_ONNX_DIR / quantized_file).exists():
+            # Exporta para ONNX e quantiza apenas na primeira execução
+            model = ORTModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL, export=True)
+            quantizer = ORTQuantizer.from_pretrained(model)
+            qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=SENTIMENT_ONNX_DIR, quantization_config=qconfig)
+            AutoTokenizer.from_pretrained(SENTIMENT_MODEL).save_pretrained(SENTIMENT_ONNX_DIR)
+
+        model = ORTModelForSequenceClassification.from_pretrained(
+            SENTIMENT_ONNX_DIR,
+            file_name=quantized_file,
+            provider="CPUExecutionProvider"
+        )
+        tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_ONNX_DIR)
+        return pipeline(
+            "sentiment-analysis",
+            model=model,
+            tokenizer=tokenizer,
+            max_length=512
+        )
+
     async def get_potential_pairs(self, bot_display: Optional['Display'] = None) -> List[str]:
         """Retorna lista de pares com potencial de arbitragem"""
         operation_id = debug_logger.start_operation('get_potential_pairs')
@@ -111,26 +224,52 @@ class AIPairFinder:
             debug_logger.log_event('market_analysis', 'Iniciando análise de mercado')
             display.console.print("\n[bold green]Iniciando análise de mercado...[/]\n")
             
-            scored_pairs = await self._analyze_market_data(pairs, display)
-            debug_logger.log_metric('pairs_analyzed', len(scored_pairs))
-            
-            # Atualiza display final
-            display.refresh_display()
+            # Pipeline em colunas: scores (N x 4) sem dicts intermediários por par
+            names, scores, market = await self._score_columns(pairs)
+            debug_logger.log_metric('pairs_analyzed', len(names))
             
             if self.sentiment_analyzer:
                 debug_logger.log_event('sentiment_analysis', 'Iniciando análise de sentimento')
-                scored_pairs = await self._apply_sentiment_analysis(scored_pairs)
-                debug_logger.log_metric('sentiment_analyzed', len(scored_pairs))
+                await self._apply_sentiment_analysis(names, scores)
+                debug_logger.log_metric('sentiment_analyzed', len(names))
             
             debug_logger.log_event('pair_selection', 'Selecionando melhores pares')
-            selected_pairs = self._select_best_pairs(scored_pairs)
+            top_idx, final_scores = self._select_best_pairs(scores)
+            
+            # Materializa dicts apenas para os pares selecionados
+            top_pairs = [
+                {
+                    'pair': str(names[i]),
+                    'final_score': float(final_scores[i]),
+                    'volume_score': float(scores[i, 0]),
+                    'volatility_score': float(scores[i, 1]),
+                    'spread_score': float(scores[i, 2]),
+                    'sentiment_score': float(scores[i, 3]),
+                    'volume_24h': float(market[i, 0]),
+                    'spread': float(market[i, 1]),
+                    'price_change': float(market[i, 2])
+                }
+                for i in top_idx
+            ]
+            selected_pairs = [p['pair'] for p in top_pairs]
+            
+            # Atualiza display com dados do mercado dos pares selecionados
+            for p in top_pairs:
+                display.update_market_data(p['pair'], {
+                    'volume_24h': p['volume_24h'],
+                    'spread': p['spread'],
+                    'price_change': p['price_change'],
+                    'liquidity_score': p['volume_24h'] / 100  # Normaliza liquidez
+                })
+            display.refresh_display()
             
             self.cache['pairs'] = selected_pairs
+            self.cache['top_pairs'] = top_pairs
             self.last_update = datetime.now()
             
             debug_logger.end_operation(operation_id, 'success', {
                 'pairs_found': len(pairs),
-                'pairs_analyzed': len(scored_pairs),
+                'pairs_analyzed': len(names),
                 'pairs_selected': len(selected_pairs)
             })
             
@@ -150,32 +289,49 @@ class AIPairFinder:
             return False
         return datetime.now() - self.last_update < self.cache_duration
 
-    @handle_errors(retries=3, delay=1.0)
-    @circuit_breaker(api_circuit, "get_binance_pairs")
-    async def _get_binance_pairs(self) -> List[str]:
-        """Obtém lista real de pares da Binance"""
-        start_time = time.time()
-        try:
+    async def _ensure_client(self) -> 'AsyncClient':
+        """Cria o cliente Binance uma única vez e o compartilha entre todas as chamadas"""
+        if self.client:
+            return self.client
+
+        # Lock criado sob demanda para pertencer ao event loop em execução
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+
+        async with self._client_lock:
             if not self.client:
-                client_start = time.time()
-                self.client = await AsyncClient.create()
-                client_latency = time.time() - client_start
+                from .binance_init import create_async_client
+
+                client_start = time.monotonic_ns()
+                self.client = await create_async_client()
+                client_latency = (time.monotonic_ns() - client_start) / 1e9
                 metrics_manager.record_metric(
                     'binance_client_init_latency',
                     client_latency,
                     {'status': 'success' if self.client else 'failed', 'latency': str(client_latency)}
                 )
-                
+
                 if not self.client:
                     raise APIError(
                         "Falha ao criar cliente Binance",
                         "BINANCE_CLIENT_ERROR",
                         {"reason": "Cliente não inicializado"}
                     )
-            
-            api_start = time.time()
-            exchange_info = await self.client.get_exchange_info()
-            api_latency = time.time() - api_start
+        return self.client
+
+    @handle_errors(retries=3, delay=1.0)
+    @circuit_breaker(api_circuit, "get_binance_pairs")
+    async def _get_binance_pairs(self) -> List[str]:
+        """Obtém lista real de pares da Binance"""
+        from binance.exceptions import BinanceAPIException
+
+        start_time = time.time()
+        try:
+            client = await self._ensure_client()
+
+            api_start = time.monotonic_ns()
+            exchange_info = await client.get_exchange_info()
+            api_latency = (time.monotonic_ns() - api_start) / 1e9
             
             metrics_manager.record_metric(
                 'binance_api_latency',
@@ -189,35 +345,26 @@ class AIPairFinder:
                     {"response": str(exchange_info)}
                 )
 
-            process_start = time.time()
-            valid_pairs = []
-            error_count = 0
-            
-            for symbol in exchange_info['symbols']:
-                try:
-                    if (symbol['status'] == 'TRADING' and
-                        symbol['isSpotTradingAllowed'] and
-                        not symbol['isMarginTradingAllowed']):  # Apenas spot trading
-                        valid_pairs.append(symbol['symbol'])
-                except KeyError as ke:
-                    error_count += 1
-                    error_tracker.track_error(
-                        ValidationError(
-                            "Dados de símbolo inválidos",
-                            "INVALID_SYMBOL_DATA",
-                            {"symbol": str(symbol), "missing_key": str(ke)}
-                        )
-                    )
-                    continue
+            process_start = time.monotonic_ns()
+            symbols = exchange_info['symbols']
+            # Apenas spot trading; .get() evita o custo de try/except por símbolo
+            valid_pairs = [
+                s['symbol'] for s in symbols
+                if s.get('status') == 'TRADING'
+                and s.get('isSpotTradingAllowed')
+                and not s.get('isMarginTradingAllowed')
+                and 'symbol' in s
+            ]
+            filtered_count = len(symbols) - len(valid_pairs)
             
-            processing_time = time.time() - process_start
+            processing_time = (time.monotonic_ns() - process_start) / 1e9
             metrics_manager.record_metric(
                 'pair_processing_time',
                 processing_time,
                 {
-                    'total_pairs': str(len(exchange_info['symbols'])),
+                    'total_pairs': str(len(symbols)),
                     'valid_pairs': str(len(valid_pairs)),
-                    'error_count': str(error_count)
+                    'filtered_count': str(filtered_count)
                 }
             )
             
@@ -225,7 +372,7 @@ class AIPairFinder:
                 raise ValidationError(
                     "Nenhum par válido encontrado",
                     "NO_VALID_PAIRS",
-                    {"total_symbols": len(exchange_info['symbols'])}
+                    {"total_symbols": len(symbols)}
                 )
             
             self.logger.info(f"Obtidos {len(valid_pairs)} pares válidos da Binance")
@@ -250,20 +397,74 @@ class AIPairFinder:
 
     @handle_errors(retries=3, delay=1.0)
     @circuit_breaker(api_circuit, "analyze_market_data")
-    async def _analyze_market_data(self, pairs: List[str], bot_display: Optional['Display'] = None) -> List[Dict]:
-        """Analisa dados reais de mercado dos pares"""
-        from ..ui.display import Display
-        self.display = bot_display or Display()
+    async def _score_columns(self, pairs: List[str]) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Analisa dados reais de mercado dos pares em colunas NumPy
+        
+        Returns:
+            Tuple: (nomes (N,), scores (N, 4): volume, volatilidade, spread e
+            sentimento, mercado (N, 3): volume 24h, spread e variação de preço)
+        """
+        import numpy as np
+        from binance.exceptions import BinanceAPIException
+        from . import kernels
+
         if not pairs:
             raise ValidationError(
                 "Lista de pares vazia",
                 "EMPTY_PAIRS_LIST"
             )
 
-        scored_pairs = []
         errors = []
 
-        for pair in pairs:
+        client = await self._ensure_client()
+
+        valid_pairs = []
+        valid_rows = []  # (volume, preço médio, variação %, último preço, ask, bid)
+
+        # Ticker em lote e order books em paralelo, limitados por concorrência e pelo
+        # peso da Binance; cada requisição tem seu próprio timeout e as falhas ficam
+        # restritas ao par, preservando os order books já obtidos
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        bucket = self._weight_bucket
+
+        async def fetch_tickers() -> List[Dict]:
+            await bucket.acquire(TICKER_24H_ALL_WEIGHT)
+            try:
+                return await asyncio.wait_for(client.get_ticker(), timeout=10.0)
+            except asyncio.TimeoutError:
+                raise APIError(
+                    "Timeout ao obter tickers de mercado",
+                    "API_TIMEOUT",
+                    {"pairs_count": len(pairs)}
+                )
+
+        async def fetch_depth(symbol: str) -> Dict:
+            async with semaphore:
+                await bucket.acquire(ORDER_BOOK_WEIGHT)
+                try:
+                    return await asyncio.wait_for(
+                        client.get_order_book(symbol=symbol, limit=5),
+                        timeout=5.0
+                    )
+                except asyncio.TimeoutError:
+                    raise APIError(
+                        f"Timeout ao obter dados do par {symbol}",
+                        "API_TIMEOUT",
+                        {"pair": symbol}
+                    )
+
+        tickers, *depths = await asyncio.gather(
+            fetch_tickers(),
+            *(fetch_depth(pair) for pair in pairs),
+            return_exceptions=True
+        )
+
+        if isinstance(tickers, Exception):
+            raise tickers
+        all_tickers = {t['symbol']: t for t in tickers}
+
+        for pair, depth in zip(pairs, depths):
             try:
                 if not isinstance(pair, str) or len(pair) < 4:
                     raise ValidationError(
@@ -272,36 +473,14 @@ class AIPairFinder:
                         {"pair": pair}
                     )
 
-                # Verifica e inicializa cliente se necessário
-                if not self.client:
-                    self.client = await AsyncClient.create()
-                    if not self.client:
-                        raise APIError(
-                            "Falha ao criar cliente Binance",
-                            "BINANCE_CLIENT_ERROR",
-                            {"reason": "Cliente não inicializado"}
-                        )
+                if isinstance(depth, Exception):
+                    raise depth
 
-                # Obtém dados reais do mercado com timeout
-                try:
-                    ticker_task = asyncio.create_task(
-                        asyncio.wait_for(
-                            self.client.get_ticker(symbol=pair),
-                            timeout=5.0
-                        )
-                    )
-                    depth_task = asyncio.create_task(
-                        asyncio.wait_for(
-                            self.client.get_order_book(symbol=pair, limit=5),
-                            timeout=5.0
-                        )
-                    )
-                    
-                    ticker, depth = await asyncio.gather(ticker_task, depth_task)
-                except asyncio.TimeoutError:
-                    raise APIError(
-                        f"Timeout ao obter dados do par {pair}",
-                        "API_TIMEOUT",
+                ticker = all_tickers.get(pair)
+                if ticker is None:
+                    raise ValidationError(
+                        f"Ticker não encontrado para {pair}",
+                        "MISSING_TICKER_DATA",
                         {"pair": pair}
                     )
 
@@ -321,47 +500,15 @@ class AIPairFinder:
                         {"depth": depth}
                     )
 
-                # Calcula métricas com validação
-                try:
-                    volume_24h = float(ticker['volume']) * float(ticker['weightedAvgPrice'])
-                    best_ask = float(depth['asks'][0][0])
-                    best_bid = float(depth['bids'][0][0])
-                    spread = (best_ask - best_bid) / best_bid
-                    price_change = abs(float(ticker['priceChangePercent']))
-                except (ValueError, IndexError) as e:
-                    raise ValidationError(
-                        f"Erro ao converter dados do par {pair}",
-                        "DATA_CONVERSION_ERROR",
-                        {"error": str(e)}
-                    )
-
-                score = {
-                    'pair': pair,
-                    'volume_score': min(volume_24h / 1000000, 1.0),
-                    'volatility_score': min(price_change / 10, 1.0),
-                    'spread_score': 1 - min(spread * 100, 1.0),
-                    'raw_data': {
-                        'volume_24h': volume_24h,
-                        'spread': spread,
-                        'price_change': price_change,
-                        'last_price': float(ticker['lastPrice']),
-                        'best_bid': best_bid,
-                        'best_ask': best_ask,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                }
-
-                # Atualiza display com dados formatados
-                # Atualiza display com dados do mercado
-                self.display.update_market_data(pair, {
-                    'volume_24h': volume_24h,
-                    'spread': spread,
-                    'price_change': price_change,
-                    'liquidity_score': volume_24h/100  # Normaliza liquidez
-                })
-                self.display.refresh_display()
-                
-                scored_pairs.append(score)
+                valid_pairs.append(pair)
+                valid_rows.append((
+                    ticker['volume'],
+                    ticker['weightedAvgPrice'],
+                    ticker['priceChangePercent'],
+                    ticker['lastPrice'],
+                    depth['asks'][0][0],
+                    depth['bids'][0][0]
+                ))
 
             except (BinanceAPIException, ValidationError, APIError) as e:
                 error_tracker.track_error(e, {'pair': pair})
@@ -380,7 +527,7 @@ class AIPairFinder:
                 })
                 continue
 
-        if not scored_pairs:
+        if not valid_pairs:
             if errors:
                 raise APIError(
                     "Falha ao analisar todos os pares",
@@ -392,13 +539,75 @@ class AIPairFinder:
                 "NO_PAIRS_ANALYZED"
             )
 
-        self.logger.info(f"Análise concluída: {len(scored_pairs)} pares analisados, {len(errors)} erros")
-        return scored_pairs
+        # Structure-of-Arrays: converte cada campo em bloco para um array tipado
+        count = len(valid_pairs)
+        try:
+            volume, avg_price, change, best_ask, best_bid = (
+                np.fromiter((row[col] for row in valid_rows), dtype=np.float64, count=count)
+                for col in (0, 1, 2, 4, 5)
+            )
+        except (ValueError, IndexError, TypeError) as e:
+            raise ValidationError(
+                "Erro ao converter dados de mercado",
+                "DATA_CONVERSION_ERROR",
+                {"error": str(e)}
+            )
+
+        names = np.array(valid_pairs)
+
+        # Descarta pares sem preço de compra válido
+        valid_bid = best_bid > 0
+        if not valid_bid.all():
+            for pair in names[~valid_bid]:
+                errors.append({
+                    'pair': str(pair),
+                    'error': f"Preço de compra inválido para {pair}",
+                    'code': 'INVALID_DEPTH_DATA'
+                })
+            names = names[valid_bid]
+            volume, avg_price, change = volume[valid_bid], avg_price[valid_bid], change[valid_bid]
+            best_ask, best_bid = best_ask[valid_bid], best_bid[valid_bid]
+            if not names.size:
+                raise APIError(
+                    "Falha ao analisar todos os pares",
+                    "ALL_PAIRS_FAILED",
+                    {"errors": errors}
+                )
+
+        volume_24h = volume * avg_price
+        spread = (best_ask - best_bid) / best_bid
+        price_change = np.abs(change)
+
+        scores = np.empty((names.size, 4), dtype=np.float64)
+        if kernels.NUMBA_AVAILABLE:
+            kernels.fill_pair_scores(volume_24h, price_change, spread, scores)
+        else:
+            np.minimum(volume_24h / 1000000, 1.0, out=scores[:, 0])
+            np.minimum(price_change / 10, 1.0, out=scores[:, 1])
+            scores[:, 2] = 1 - np.minimum(spread * 100, 1.0)
+        scores[:, 3] = 0.0  # Preenchido pela análise de sentimento
+        market = np.column_stack((volume_24h, spread, price_change))
+
+        # Detalhe por par apenas em DEBUG: evita formatação e lock do handler por par
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for pair, pair_volume, pair_spread, pair_change in zip(names, volume_24h, spread, price_change):
+                self.logger.debug(
+                    "Análise de %s: Vol=%.2f Spread=%.3f%% Chg=%.2f",
+                    pair, pair_volume, pair_spread * 100, pair_change
+                )
+
+        volume_p50, volume_p90 = np.percentile(volume_24h, [50, 90])
+        self.logger.info(
+            "Análise concluída: %d pares analisados, %d erros "
+            "(volume p50=%.2f p90=%.2f, spread médio=%.3f%%)",
+            names.size, len(errors), volume_p50, volume_p90, float(spread.mean()) * 100
+        )
+        return names, scores, market
 
     @handle_errors(retries=2, delay=0.5)  # Menos retries pois é análise secundária
-    async def _apply_sentiment_analysis(self, scored_pairs: List[Dict]) -> List[Dict]:
-        """Aplica análise de sentimento nos pares"""
-        if not scored_pairs:
+    async def _apply_sentiment_analysis(self, names: 'np.ndarray', scores: 'np.ndarray') -> 'np.ndarray':
+        """Aplica análise de sentimento nos pares, preenchendo a coluna de sentimento de scores"""
+        if not len(names):
             raise ValidationError(
                 "Lista de pares pontuados vazia",
                 "EMPTY_SCORED_PAIRS"
@@ -406,182 +615,151 @@ class AIPairFinder:
 
         if not self.sentiment_analyzer:
             self.logger.warning("Analisador de sentimento não disponível")
-            return scored_pairs
+            return scores
 
         analysis_errors = []
-        
-        for pair in scored_pairs:
-            try:
-                if not isinstance(pair, dict) or 'pair' not in pair:
-                    raise ValidationError(
-                        "Formato inválido de par pontuado",
-                        "INVALID_SCORED_PAIR_FORMAT",
-                        {"pair_data": pair}
-                    )
 
-                # Analisa o par com timeout
+        # Só envia ao modelo os símbolos ausentes ou expirados no cache
+        now = time.time()
+        texts = names.tolist()
+        expiry = now - self._sent_cache_ttl
+        uncached = list(dict.fromkeys(
+            text for text in texts
+            if self._sent_cache.get(text, (0.0,))[0] < expiry
+        ))
+
+        if uncached:
+            # Analisa todos os pares pendentes em uma única chamada em lote ao modelo
+            try:
                 try:
-                    with ThreadPoolExecutor() as executor:
-                        future = executor.submit(self.sentiment_analyzer, pair['pair'])
-                        result = await asyncio.wait_for(
-                            asyncio.wrap_future(future),
-                            timeout=2.0
-                        )
+                    results = await asyncio.wait_for(
+                        asyncio.to_thread(
+                            self.sentiment_analyzer,
+                            uncached,
+                            batch_size=64,
+                            truncation=True
+                        ),
+                        timeout=30.0
+                    )
                 except asyncio.TimeoutError:
                     raise APIError(
-                        f"Timeout na análise de sentimento para {pair['pair']}",
+                        f"Timeout na análise de sentimento para {len(uncached)} pares",
                         "SENTIMENT_TIMEOUT"
                     )
 
-                # Valida e processa resultado
-                if not result or not isinstance(result, list) or not result:
+                if not isinstance(results, list) or len(results) != len(uncached):
                     raise ValidationError(
                         "Resultado inválido da análise de sentimento",
                         "INVALID_SENTIMENT_RESULT",
-                        {"result": result}
+                        {"expected": len(uncached), "result_type": type(results).__name__}
                     )
 
-                sentiment = result[0]
-                if not isinstance(sentiment, dict) or 'label' not in sentiment:
-                    raise ValidationError(
-                        "Formato inválido do resultado de sentimento",
-                        "INVALID_SENTIMENT_FORMAT",
-                        {"sentiment": sentiment}
-                    )
+                for text, result in zip(uncached, results):
+                    self._sent_cache[text] = (now, result)
+                    self._sent_cache.move_to_end(text)
+                while len(self._sent_cache) > self._sent_cache_max_size:
+                    self._sent_cache.popitem(last=False)
 
-                # Atualiza score com confiança do modelo
-                sentiment_score = 1.0 if sentiment['label'] == 'POS' else 0.0
-                confidence = float(sentiment.get('score', 0.5))
-                
-                pair['sentiment_score'] = sentiment_score * confidence
-                pair['sentiment_data'] = {
-                    'label': sentiment['label'],
-                    'confidence': confidence,
-                    'timestamp': datetime.now().isoformat()
-                }
-
-            except (ValidationError, APIError) as e:
-                error_tracker.track_error(e, {'pair': pair.get('pair')})
-                analysis_errors.append({
-                    'pair': pair.get('pair'),
-                    'error': str(e),
-                    'code': e.error_code
-                })
-                pair['sentiment_score'] = 0.5  # Score neutro em caso de erro
             except Exception as e:
-                error_tracker.track_error(e, {'pair': pair.get('pair')})
+                error_tracker.track_error(e, {'pairs_count': len(uncached)})
+                self.logger.warning(f"Falha na análise de sentimento em lote: {e}")
+
+        sentiment_column = scores[:, 3]
+        for i, text in enumerate(texts):
+            cached = self._sent_cache.get(text)
+            if cached is None:
+                sentiment_column[i] = 0.5  # Score neutro quando o modelo falhou
+                continue
+
+            sentiment = cached[1]
+            if not isinstance(sentiment, dict) or 'label' not in sentiment:
+                error = ValidationError(
+                    "Formato inválido do resultado de sentimento",
+                    "INVALID_SENTIMENT_FORMAT",
+                    {"sentiment": sentiment}
+                )
+                error_tracker.track_error(error, {'pair': text})
                 analysis_errors.append({
-                    'pair': pair.get('pair'),
-                    'error': str(e),
-                    'code': 'UNEXPECTED_ERROR'
+                    'pair': text,
+                    'error': str(error),
+                    'code': error.error_code
                 })
-                pair['sentiment_score'] = 0.5  # Score neutro em caso de erro
+                sentiment_column[i] = 0.5  # Score neutro em caso de erro
+                continue
+
+            # Atualiza score com confiança do modelo
+            sentiment_score = 1.0 if sentiment['label'] == 'POS' else 0.0
+            sentiment_column[i] = sentiment_score * float(sentiment.get('score', 0.5))
 
         if analysis_errors:
-            self.logger.warning(f"Erros na análise de sentimento: {len(analysis_errors)} de {len(scored_pairs)} pares")
+            self.logger.warning(f"Erros na análise de sentimento: {len(analysis_errors)} de {len(texts)} pares")
 
-        return scored_pairs
+        return scores
+
+    def _select_best_pairs(self, scores: 'np.ndarray', top_n: int = 20) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Seleciona os melhores pares baseado nos scores
+        
+        Returns:
+            Tuple: (índices dos top_n pares em ordem decrescente, score final de todos os pares)
+        """
+        import numpy as np
+        from . import kernels
 
-    @handle_errors(retries=1, delay=0.1)  # Operação local, não precisa de muitas tentativas
-    def _select_best_pairs(self, scored_pairs: List[Dict]) -> List[str]:
-        """Seleciona os melhores pares baseado nos scores"""
-        if not scored_pairs:
+        if not len(scores):
             raise ValidationError(
                 "Lista de pares pontuados vazia",
                 "EMPTY_SCORED_PAIRS"
             )
 
-        try:
-            # Valida estrutura dos dados
-            for pair in scored_pairs:
-                if not isinstance(pair, dict):
-                    raise ValidationError(
-                        "Par inválido na lista",
-                        "INVALID_PAIR_FORMAT",
-                        {"pair": pair}
-                    )
-                
-                required_fields = ['volume_score', 'volatility_score', 'spread_score']
-                missing_fields = [f for f in required_fields if f not in pair]
-                if missing_fields:
-                    raise ValidationError(
-                        "Campos obrigatórios ausentes no par",
-                        "MISSING_REQUIRED_FIELDS",
-                        {"pair": pair.get('pair'), "missing_fields": missing_fields}
-                    )
+        weights = np.array([0.4, 0.3, 0.2, 0.1], dtype=np.float64)
+        top_n = min(top_n, len(scores))
 
-            # Calcula score final com pesos
-            weights = {
-                'volume_score': 0.4,
-                'volatility_score': 0.3,
-                'spread_score': 0.2,
-                'sentiment_score': 0.1
-            }
+        if kernels.NUMBA_AVAILABLE:
+            # Score ponderado e top-k fundidos em um único kernel compilado
+            top_idx = np.empty(top_n, dtype=np.int64)
+            final_scores = np.empty(len(scores), dtype=np.float64)
+            kernels.score_and_topk(scores, weights, top_n, top_idx, final_scores)
+        else:
+            # Score final ponderado: matriz N x 4 @ vetor de pesos
+            final_scores = scores @ weights
 
-            for pair in scored_pairs:
-                try:
-                    pair['final_score'] = sum(
-                        float(pair.get(key, 0)) * weight
-                        for key, weight in weights.items()
-                    )
-                except ValueError as e:
-                    raise ValidationError(
-                        f"Erro ao calcular score para {pair.get('pair')}",
-                        "SCORE_CALCULATION_ERROR",
-                        {"error": str(e), "pair_data": pair}
-                    )
-
-            # Ordena por score e seleciona os top 20
-            sorted_pairs = sorted(
-                scored_pairs,
-                key=lambda x: float(x.get('final_score', 0)),
-                reverse=True
-            )
-
-            selected = [p['pair'] for p in sorted_pairs[:20]]
-            
-            if not selected:
-                raise ValidationError(
-                    "Nenhum par selecionado após ordenação",
-                    "NO_PAIRS_SELECTED"
-                )
+            # Seleção parcial dos top N em vez de ordenar toda a lista
+            top_idx = np.argpartition(-final_scores, top_n - 1)[:top_n]
+            top_idx = top_idx[np.argsort(-final_scores[top_idx])]
 
-            self.logger.info(f"Selecionados {len(selected)} pares com melhores scores")
-            return selected
-
-        except Exception as e:
-            error_tracker.track_error(e)
-            raise ValidationError(
-                "Erro ao selecionar melhores pares",
-                "PAIR_SELECTION_ERROR",
-                {"error": str(e)}
-            )
+        self.logger.info(f"Selecionados {top_n} pares com melhores scores")
+        return top_idx, final_scores
 
     def update_performance(self, pair: str, was_profitable: bool):
         """Atualiza histórico de performance dos pares"""
-        self.performance_history.append({
-            'pair': pair,
-            'profitable': was_profitable,
-            'timestamp': datetime.now()
-        })
-        
-        # Mantém apenas últimos 1000 registros
-        if len(self.performance_history) > 1000:
-            self.performance_history = self.performance_history[-1000:]
+        # Escreve na posição atual e avança o cursor circular (O(1), sem cópias)
+        pos = self._perf_pos
+        self._perf_prof[pos] = was_profitable
+        self._perf_pair[pos] = pair
+        self._perf_ts[pos] = time.time()
+        self._perf_pos = (pos + 1) % self._perf_size
+        if self._perf_n < self._perf_size:
+            self._perf_n += 1
 
     async def get_performance_metrics(self) -> Dict:
         """Retorna métricas de performance do agente"""
+        import numpy as np
+
         try:
-            if not self.performance_history:
+            if not self._perf_n:
                 return {}
             
-            total = len(self.performance_history)
-            profitable = sum(1 for p in self.performance_history if p['profitable'])
+            total = self._perf_n
+            profitable = int(self._perf_prof[:total].sum())
             
             return {
                 'total_predictions': total,
                 'success_rate': profitable / total if total > 0 else 0,
-                'pairs_analyzed': len(set(p['pair'] for p in self.performance_history)),
+                'pairs_analyzed': int(np.unique(self._perf_pair[:total]).size),
+                'last_prediction': datetime.fromtimestamp(
+                    float(self._perf_ts[self._perf_pos - 1])
+                ).isoformat(),
                 'last_update': self.last_update.isoformat() if self.last_update else None
             }
             
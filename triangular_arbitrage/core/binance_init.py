@@ -1,11 +1,69 @@
 """
 Inicialização e configuração do cliente Binance
 """
+import gzip
+import orjson
 from binance.client import AsyncClient
-from binance.exceptions import BinanceAPIException
-from binance.streams import BinanceSocketManager
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance.streams import BinanceSocketManager, BinanceSocketType, ReconnectingWebsocket
 from binance import ThreadedWebsocketManager
 
+class OrjsonAsyncClient(AsyncClient):
+    """
+    AsyncClient que decodifica as respostas REST com orjson,
+    lendo os bytes diretamente em vez de passar pelo json da stdlib
+    """
+    async def _handle_response(self, response):
+        if not str(response.status).startswith('2'):
+            raise BinanceAPIException(response, response.status, await response.text())
+        body = await response.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise BinanceRequestException(f'Invalid Response: {body.decode(errors="replace")}')
+
+class OrjsonReconnectingWebsocket(ReconnectingWebsocket):
+    """
+    ReconnectingWebsocket que decodifica os frames com orjson
+    em vez do json da stdlib usado pela biblioteca
+    """
+    def _handle_message(self, evt):
+        if self._is_binary:
+            try:
+                evt = gzip.decompress(evt)
+            except (ValueError, OSError):
+                return None
+        try:
+            return orjson.loads(evt)
+        except orjson.JSONDecodeError:
+            self._log.debug(f'error parsing evt json:{evt}')
+            return None
+
+class OrjsonSocketManager(BinanceSocketManager):
+    """
+    BinanceSocketManager cujos sockets públicos usam OrjsonReconnectingWebsocket
+    """
+    def _get_socket(
+        self, path: str, stream_url=None, prefix: str = 'ws/', is_binary: bool = False,
+        socket_type: BinanceSocketType = BinanceSocketType.SPOT
+    ) -> ReconnectingWebsocket:
+        conn_id = f'{socket_type}_{path}'
+        if conn_id not in self._conns:
+            self._conns[conn_id] = OrjsonReconnectingWebsocket(
+                path=path,
+                url=self._get_stream_url(stream_url),
+                prefix=prefix,
+                exit_coro=lambda p: self._exit_socket(f'{socket_type}_{p}'),
+                is_binary=is_binary,
+            )
+        return self._conns[conn_id]
+
+async def create_async_client(*args, **kwargs) -> AsyncClient:
+    """
+    Cria o cliente assíncrono da Binance com parsing JSON otimizado
+    """
+    return await OrjsonAsyncClient.create(*args, **kwargs)
+
 def get_binance_imports():
     """
     Retorna os imports necessários do Binance
@@ -13,8 +71,10 @@ def get_binance_imports():
     """
     return {
         'AsyncClient': AsyncClient,
+        'OrjsonAsyncClient': OrjsonAsyncClient,
         'BinanceAPIException': BinanceAPIException,
         'BinanceSocketManager': BinanceSocketManager,
+        'OrjsonSocketManager': OrjsonSocketManager,
         'ThreadedWebsocketManager': ThreadedWebsocketManager
     }
 
@@ -31,9 +91,12 @@ def validate_binance_imports():
 
 __all__ = [
     'AsyncClient',
+    'OrjsonAsyncClient',
     'BinanceAPIException',
     'BinanceSocketManager',
+    'OrjsonSocketManager',
     'ThreadedWebsocketManager',
+    'create_async_client',
     'get_binance_imports',
     'validate_binance_imports'
 ]
\ No newline at end of file
@@ -3,49 +3,98 @@ Cliente WebSocket para Binance
 """
 from .binance_init import (
     AsyncClient,
-    BinanceSocketManager,
-    ThreadedWebsocketManager
+    BinanceSocketManager
 )
 import asyncio
-import json
+import collections
 import logging
-import time
-from contextlib import AsyncExitStack
+import random
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Serialização JSON compartilhada pelo cliente e pelos callbacks
+loads = orjson.loads
+
+
+def dumps(obj) -> str:
+    """Serializa para str usando orjson"""
+    return orjson.dumps(obj).decode()
+
+
 class BinanceWebsocketClient:
+    """
+    Cliente WebSocket da Binance com buffer de mensagens em background
+
+    O loop suportado é o uvloop, instalado por configure_event_loop() antes
+    da criação do loop; o cliente não altera a policy escolhida pelo chamador.
+    """
+    __slots__ = (
+        'api_key', 'api_secret', 'client', 'bm',
+        '_sync_callbacks', '_async_callbacks', '_stream_callbacks',
+        '_frozen_sync_callbacks', '_frozen_async_callbacks', '_frozen_stream_callbacks',
+        '_callbacks_frozen', '_running', '_reconnect_delay', '_connection_lock',
+        '_cleanup_event', '_active_tasks', '_loop', '_last_heartbeat',
+        '_ping_handle', '_receiver_task',
+        '_stream_buffer', '_message_waiter', '_buffer_high', '_buffer_low', '_buffer_drained',
+        'ping_interval', 'response_timeout', 'max_message_size', 'compression'
+    )
+
     def __init__(self, api_key, api_secret):
         self.api_key = api_key
         self.api_secret = api_secret
         self.client = None
-        self.twm = None  # ThreadedWebsocketManager
-        self.conn_key = None
-        self._callbacks = []
+        self.bm = None  # BinanceSocketManager (mesmo event loop, sem thread extra)
+        # Callbacks curinga (todas as mensagens); síncronos são chamados sem criar corrotina
+        self._sync_callbacks = []
+        self._async_callbacks = []
+        # Callbacks por stream: nome do stream -> ([síncronos], [async])
+        self._stream_callbacks = {}
+        # Snapshots imutáveis iterados no caminho quente, gerados no início do socket
+        self._frozen_sync_callbacks = ()
+        self._frozen_async_callbacks = ()
+        self._frozen_stream_callbacks = {}
+        self._callbacks_frozen = False
         self._running = True
         self._reconnect_delay = 0.5  # Reduzido para 0.5s
         self._connection_lock = asyncio.Lock()
         self._cleanup_event = asyncio.Event()
         self._active_tasks = set()
-        self._last_heartbeat = time.time()
+        self._loop = None  # Definido em connect(); relógio monotônico via loop.time()
+        self._last_heartbeat = 0.0
+        self._ping_handle = None  # asyncio.TimerHandle do próximo heartbeat
+        self._receiver_task = None
         
-        # Aumenta tamanho do buffer
-        self._stream_buffer = asyncio.Queue(maxsize=50000)
+        # Buffer sem locks: deque + future acordado pelo produtor quando há dados
+        self._stream_buffer = collections.deque(maxlen=50000)
+        self._message_waiter = None  # asyncio.Future aguardado pelo consumidor
+
+        # Controle de fluxo: pausa a leitura do socket acima da marca alta
+        # e retoma quando o consumidor drena abaixo da marca baixa
+        self._buffer_high = 40000
+        self._buffer_low = 10000
+        self._buffer_drained = asyncio.Event()
+        self._buffer_drained.set()
         
         # Configurações otimizadas
         self.ping_interval = 30  # Heartbeat a cada 30s
         self.response_timeout = 10  # Timeout de 10s para respostas
         self.max_message_size = 10 * 1024 * 1024  # 10MB
-        self.compression = True  # Habilita compressão
+        # permessage-deflate é negociado por padrão pelo websockets usado no
+        # BinanceSocketManager, com um contexto zlib por conexão (context takeover)
+        self.compression = True
 
     async def connect(self, max_retries=3):
         """Estabelece conexão com Binance Websocket com retentativas"""
         async with self._connection_lock:
             retry_count = 0
+            self._loop = asyncio.get_running_loop()
+            logger.debug("Event loop em uso: %s", type(self._loop).__module__)
             
             while retry_count < max_retries and self._running:
                 try:
-                    logger.info(f"Tentativa {retry_count + 1} de conexão com Binance WebSocket")
+                    logger.info("Tentativa %d de conexão com Binance WebSocket", retry_count + 1)
                     
                     await self._cleanup_connections()
                     
@@ -55,11 +104,9 @@ class BinanceWebsocketClient:
                         requests_params={'timeout': 30}
                     )
                     
-                    self.twm = ThreadedWebsocketManager(
-                        api_key=self.api_key,
-                        api_secret=self.api_secret
-                    )
-                    self.twm.start()
+                    self.bm = BinanceSocketManager(self.client)
+                    # TCP_NODELAY já é aplicado pelo asyncio a todo transporte TCP
+                    # (REST via aiohttp e WebSocket via websockets), sem atraso de Nagle
                     
                     # Testa conexão
                     for _ in range(3):
@@ -68,7 +115,8 @@ class BinanceWebsocketClient:
                                 await self.client.ping()
                                 logger.info("Binance WebSocket Client conectado com sucesso")
                                 self._reconnect_delay = 1
-                                self._last_heartbeat = time.time()
+                                self._last_heartbeat = self._loop.time()
+                                self._schedule_ping()
                                 return True
                         except Exception as e:
                             if _ < 2:
@@ -78,147 +126,267 @@ class BinanceWebsocketClient:
                                 
                 except Exception as e:
                     retry_count += 1
-                    logger.error(f"Falha na tentativa {retry_count}: {e}")
+                    logger.error("Falha na tentativa %d: %s", retry_count, e)
                     
                     if retry_count < max_retries and self._running:
-                        await asyncio.sleep(self._reconnect_delay)
+                        # Backoff exponencial com full jitter para evitar reconexões sincronizadas
                         self._reconnect_delay = min(self._reconnect_delay * 2, 60)
+                        await asyncio.sleep(random.uniform(0, self._reconnect_delay))
                         continue
                     
-                    logger.error(f"Falha ao conectar após {max_retries} tentativas")
+                    logger.error("Falha ao conectar após %d tentativas", max_retries)
                     return False
             
             return False
 
     async def start_multiplex_socket(self, streams):
         """Inicia socket multiplexado com reconexão automática e buffer otimizado"""
+        self._loop = asyncio.get_running_loop()
+        self._freeze_callbacks()
         while self._running:
             try:
-                logger.info(f"Iniciando socket multiplexado para {len(streams)} streams")
+                logger.info("Iniciando socket multiplexado para %d streams", len(streams))
                 
-                if not self.twm:
+                if not self.bm:
                     logger.error("Socket manager não inicializado")
                     await asyncio.sleep(2)  # Reduzido para 2s
                     continue
 
-                # Configura handler com buffer
-                async def handle_socket_message(msg):
-                    try:
-                        if not self._stream_buffer.full():
-                            await self._stream_buffer.put(msg)
-                        else:
-                            logger.warning("Buffer cheio, descartando mensagem")
-                            # Processa mensagens antigas do buffer
-                            while not self._stream_buffer.empty():
-                                old_msg = await self._stream_buffer.get()
-                                await self._process_message(old_msg)
-                    except Exception as e:
-                        logger.error(f"Erro no handler: {e}")
-
-                # Inicia socket com configurações otimizadas
-                self.conn_key = self.twm.start_multiplex_socket(
-                    callback=handle_socket_message,
-                    streams=streams
-                )
-                
-                logger.info(f"Socket multiplexado iniciado: {len(streams)} streams")
-                
-                # Inicia processador de buffer em background
+                # Recepção e processamento rodam no próprio event loop
+                receiver = asyncio.create_task(self._receive_messages(streams))
                 buffer_processor = asyncio.create_task(self._process_buffer())
-                self._active_tasks.add(buffer_processor)
+                for task in (receiver, buffer_processor):
+                    self._active_tasks.add(task)
+                    task.add_done_callback(self._active_tasks.discard)
                 
-                while self._running:
-                    current_time = time.time()
-                    
-                    # Heartbeat mais frequente
-                    if current_time - self._last_heartbeat >= self.ping_interval:
-                        try:
-                            if self.client:
-                                await asyncio.wait_for(
-                                    self.client.ping(),
-                                    timeout=self.response_timeout
-                                )
-                                self._last_heartbeat = current_time
-                                logger.debug("Heartbeat enviado com sucesso")
-                        except asyncio.TimeoutError:
-                            logger.warning("Timeout no heartbeat, reiniciando conexão")
-                            break
-                        except Exception as e:
-                            logger.error(f"Erro no heartbeat: {e}")
-                            break
-                    
-                    await asyncio.sleep(0.1)  # Reduzido para 100ms
-                    
+                logger.info("Socket multiplexado iniciado: %d streams", len(streams))
+                
+                # Heartbeat roda fora deste caminho (call_later); aqui só se aguarda
+                # o encerramento ou a queda do receptor, sem acordar periodicamente
+                self._receiver_task = receiver
+                stop_waiter = asyncio.create_task(self._cleanup_event.wait())
+                await asyncio.wait(
+                    (receiver, stop_waiter),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                stop_waiter.cancel()
+
+                # Encerra as tarefas desta conexão antes de reabrir o socket
+                for task in (receiver, buffer_processor):
+                    task.cancel()
+                await asyncio.gather(receiver, buffer_processor, return_exceptions=True)
+
+                if self._running:
+                    logger.warning("Socket multiplexado encerrado, reiniciando conexão")
+                    self._reconnect_delay = min(self._reconnect_delay * 2, 30)
+                    await asyncio.sleep(random.uniform(0, self._reconnect_delay))
+
             except Exception as e:
                 if not self._running:
                     break
-                logger.error(f"Erro no socket: {e}")
-                await asyncio.sleep(self._reconnect_delay)
-                self._reconnect_delay = min(self._reconnect_delay * 1.5, 30)  # Backoff exponencial
+                logger.error("Erro no socket: %s", e)
+                # Backoff exponencial com full jitter
+                self._reconnect_delay = min(self._reconnect_delay * 2, 30)
+                await asyncio.sleep(random.uniform(0, self._reconnect_delay))
                 continue
 
+    def _schedule_ping(self):
+        """Agenda o próximo heartbeat no timer do event loop"""
+        if self._ping_handle is not None:
+            self._ping_handle.cancel()
+        self._ping_handle = self._loop.call_later(self.ping_interval, self._fire_ping)
+
+    def _fire_ping(self):
+        """Dispara o heartbeat em background e reagenda o próximo"""
+        self._ping_handle = None
+        if not self._running or not self.client:
+            return
+        task = asyncio.create_task(self._ping())
+        self._active_tasks.add(task)
+        task.add_done_callback(self._active_tasks.discard)
+        self._schedule_ping()
+
+    async def _ping(self):
+        """Envia o heartbeat; em caso de falha derruba o receptor para reconectar"""
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(self.client.ping()),
+                timeout=self.response_timeout
+            )
+            self._last_heartbeat = self._loop.time()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Heartbeat enviado com sucesso")
+            return
+        except asyncio.TimeoutError:
+            logger.warning("Timeout no heartbeat, reiniciando conexão")
+        except Exception as e:
+            logger.error("Erro no heartbeat: %s", e)
+
+        receiver = self._receiver_task
+        if receiver is not None and not receiver.done():
+            receiver.cancel()
+
+    async def _receive_messages(self, streams):
+        """Lê o socket multiplexado e enfileira as mensagens no buffer"""
+        enqueue = self._enqueue
+        buf = self._stream_buffer
+        drained = self._buffer_drained
+        async with self.bm.multiplex_socket(streams) as socket:
+            while self._running:
+                if len(buf) >= self._buffer_high:
+                    # Back-pressure via janela TCP em vez de descartar ticks
+                    drained.clear()
+                    self._set_socket_reading(socket, False)
+                    try:
+                        await drained.wait()
+                    finally:
+                        self._set_socket_reading(socket, True)
+
+                msg = await socket.recv()
+                if msg:
+                    enqueue(msg)
+
+    @staticmethod
+    def _set_socket_reading(socket, enabled):
+        """Pausa ou retoma a leitura do transporte do websocket, se acessível"""
+        transport = getattr(getattr(socket, 'ws', None), 'transport', None)
+        if transport is None:
+            return
+        try:
+            if enabled:
+                transport.resume_reading()
+            else:
+                transport.pause_reading()
+        except (AttributeError, RuntimeError) as e:
+            logger.debug("Controle de fluxo indisponível no transporte: %s", e)
+
+    def _enqueue(self, msg):
+        """Adiciona mensagem ao buffer e acorda o consumidor se estiver dormindo"""
+        buf = self._stream_buffer
+        if len(buf) == buf.maxlen:
+            logger.warning("Buffer cheio, descartando mensagem mais antiga")
+        buf.append(msg)
+        waiter = self._message_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
     async def _process_message(self, msg):
         """Processa mensagens recebidas do WebSocket"""
         try:
+            # Alguns caminhos entregam o frame bruto em vez do dict já decodificado
+            if isinstance(msg, (bytes, bytearray, memoryview, str)):
+                msg = loads(msg)
+
             if msg.get('e') == 'error':
-                logger.error(f"Erro no WebSocket: {msg.get('m')}")
+                logger.error("Erro no WebSocket: %s", msg.get('m'))
                 return
-            
-            for callback in self._callbacks:
+
+            # Referências locais evitam buscas de atributo por mensagem
+            log_err = logger.error
+            sync_callbacks = self._frozen_sync_callbacks
+            async_callbacks = self._frozen_async_callbacks
+
+            # Despacho O(1) para os interessados no stream da mensagem
+            by_stream = self._frozen_stream_callbacks
+            if by_stream:
+                targeted = by_stream.get(msg.get('stream') or msg.get('s'))
+                if targeted:
+                    sync_callbacks = sync_callbacks + targeted[0]
+                    async_callbacks = async_callbacks + targeted[1]
+
+            for callback in sync_callbacks:
+                try:
+                    callback(msg)
+                except Exception as e:
+                    log_err("Erro no callback: %s", e)
+            for callback in async_callbacks:
                 try:
                     await callback(msg)
                 except Exception as e:
-                    logger.error(f"Erro no callback: {e}")
-                    
+                    log_err("Erro no callback: %s", e)
+
         except Exception as e:
-            logger.error(f"Erro ao processar mensagem: {e}")
+            logger.error("Erro ao processar mensagem: %s", e)
 
     async def _process_buffer(self):
         """Processa mensagens do buffer em background"""
+        loop = self._loop or asyncio.get_running_loop()
+        buf = self._stream_buffer
+        popleft = buf.popleft
+        process = self._process_message
+        drained = self._buffer_drained
+        low = self._buffer_low
         while self._running:
             try:
-                if not self._stream_buffer.empty():
-                    msg = await self._stream_buffer.get()
-                    await self._process_message(msg)
-                    self._stream_buffer.task_done()
-                else:
-                    await asyncio.sleep(0.01)  # Pequena pausa quando buffer vazio
+                # Esvazia o buffer em lotes de até 256 mensagens, cedendo o loop
+                # entre lotes para não atrasar o heartbeat sob carga alta
+                while buf:
+                    batch = [popleft() for _ in range(min(len(buf), 256))]
+                    for msg in batch:
+                        await process(msg)
+                    if len(buf) <= low and not drained.is_set():
+                        drained.set()
+                    await asyncio.sleep(0)
+
+                # Dorme até o produtor sinalizar novas mensagens (sem polling)
+                self._message_waiter = loop.create_future()
+                if buf:
+                    continue
+                await self._message_waiter
             except Exception as e:
-                logger.error(f"Erro no processamento do buffer: {e}")
+                logger.error("Erro no processamento do buffer: %s", e)
                 await asyncio.sleep(0.1)  # Pausa maior em caso de erro
 
-    def add_callback(self, callback):
-        """Adiciona callback para processamento de mensagens"""
-        self._callbacks.append(callback)
+    def add_callback(self, callback, stream=None):
+        """
+        Adiciona callback para processamento de mensagens (síncrono ou async)
+
+        Args:
+            callback: função chamada com cada mensagem
+            stream: nome do stream (ex: 'btcusdt@ticker') ou símbolo; None recebe todas
+        """
+        if stream is None:
+            sync_list, async_list = self._sync_callbacks, self._async_callbacks
+        else:
+            sync_list, async_list = self._stream_callbacks.setdefault(stream, ([], []))
+
+        if asyncio.iscoroutinefunction(callback):
+            async_list.append(callback)
+        else:
+            sync_list.append(callback)
+
+        if self._callbacks_frozen:
+            logger.warning("Callback adicionado após o início do socket; registre antes de start_multiplex_socket")
+            self._freeze_callbacks()
+
+    def _freeze_callbacks(self):
+        """Congela as listas de callbacks em tuplas para iteração no caminho quente"""
+        self._frozen_sync_callbacks = tuple(self._sync_callbacks)
+        self._frozen_async_callbacks = tuple(self._async_callbacks)
+        self._frozen_stream_callbacks = {
+            stream: (tuple(sync_list), tuple(async_list))
+            for stream, (sync_list, async_list) in self._stream_callbacks.items()
+        }
+        self._callbacks_frozen = True
 
     async def _cleanup_connections(self):
         """Limpa conexões existentes e recursos"""
         try:
-            # Cancela tarefas ativas
-            for task in self._active_tasks:
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
+            if self._ping_handle is not None:
+                self._ping_handle.cancel()
+                self._ping_handle = None
+
+            # Cancela todas as tarefas ativas e aguarda o encerramento em paralelo
+            tasks = list(self._active_tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             self._active_tasks.clear()
 
             # Limpa buffer
-            while not self._stream_buffer.empty():
-                try:
-                    self._stream_buffer.get_nowait()
-                    self._stream_buffer.task_done()
-                except asyncio.QueueEmpty:
-                    break
-
-            # Para WebSocket Manager
-            if self.twm:
-                try:
-                    self.twm.stop()
-                    await asyncio.sleep(0.5)  # Aguarda finalização
-                except Exception as e:
-                    logger.error(f"Erro ao parar TWM: {e}")
+            self._stream_buffer.clear()
+            self._message_waiter = None
+            self._buffer_drained.set()
 
             # Fecha conexão com cliente
             if self.client:
@@ -230,19 +398,22 @@ class BinanceWebsocketClient:
                 except asyncio.TimeoutError:
                     logger.warning("Timeout ao fechar conexão do cliente")
                 except Exception as e:
-                    logger.error(f"Erro ao fechar cliente: {e}")
+                    logger.error("Erro ao fechar cliente: %s", e)
 
         except Exception as e:
-            logger.error(f"Erro na limpeza: {e}")
+            logger.error("Erro na limpeza: %s", e)
         finally:
-            self.twm = None
+            self.bm = None
             self.client = None
-            self.conn_key = None
+            self._receiver_task = None
             logger.info("Conexões e recursos limpos")
 
     async def close(self):
         """Fecha conexões e limpa recursos"""
         self._running = False
         await self._cleanup_connections()
-        self._callbacks.clear()
+        self._sync_callbacks.clear()
+        self._async_callbacks.clear()
+        self._stream_callbacks.clear()
+        self._freeze_callbacks()
         self._cleanup_event.set()
\ No newline at end of file
@@ -1,14 +1,18 @@
 """
 Núcleo do bot de arbitragem
 """
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import logging
 import asyncio
+import collections
+import heapq
 import time
-import json
 import os
 from datetime import datetime
-from decimal import Decimal
+from operator import itemgetter
+
+import numpy as np
+import orjson
 
 from ..config import (
     BINANCE_CONFIG, 
@@ -20,12 +24,49 @@ from .connection_manager import ConnectionManager
 from .currency_core import CurrencyCore
 from .events_core import EventsCore
 from .ai_pair_finder import AIPairFinder
+from . import kernels
 from .ai.arbitrage_analyzer import ArbitrageAnalyzer
 from ..utils.backup_manager import BackupManager
 from ..utils.logger import Logger
 
 logger = logging.getLogger(__name__)
 
+# Multiplicadores de taxa (0.1%) aplicados a ask/bid no caminho quente
+ASK_MUL = 1.001
+BID_MUL = 0.999
+
+# Colunas da tabela de livro (uma linha contígua por símbolo)
+BID, ASK, BID_QTY, ASK_QTY = range(4)
+
+# Campos do payload bookTicker (símbolo, bid, ask, bid_qty, ask_qty) lidos numa única chamada
+_BOOK_TICKER_FIELDS = itemgetter('s', 'b', 'a', 'B', 'A')
+
+# Moedas base usadas na formação dos triângulos
+BASES = ('BTC', 'ETH', 'USDT', 'BNB')
+
+# Intervalo mínimo entre detecções (s), cooldown de execução por triângulo (s) e
+# intervalo mínimo entre avisos de fila cheia (s)
+DETECT_INTERVAL = 0.1
+EXECUTION_COOLDOWN = 5.0
+DROP_LOG_INTERVAL = 5.0
+
+# Por perna do triângulo (A compra no ask; B e C vendem no bid): coluna de preço,
+# coluna de quantidade e multiplicador de taxa
+_LEGS = np.arange(3)
+_LEG_PRICE = np.array([ASK, BID, BID])
+_LEG_QTY = np.array([ASK_QTY, BID_QTY, BID_QTY])
+_LEG_FEE_MUL = np.array([ASK_MUL, BID_MUL, BID_MUL])
+
+
+def _strip_base(symbol: str, base: str) -> Optional[str]:
+    """Retorna a outra moeda do par se base for prefixo ou sufixo do símbolo"""
+    if symbol.startswith(base):
+        return symbol[len(base):]
+    if symbol.endswith(base):
+        return symbol[:-len(base)]
+    return None
+
+
 class BotCore:
     def __init__(self, config: Optional[Dict] = None):
         """Inicializa o bot"""
@@ -100,26 +141,89 @@ class BotCore:
         self.arbitrage_analyzer = ArbitrageAnalyzer()
         
         # Cache e controles
-        self._price_cache_lock = asyncio.Lock()
         self.price_cache = {}
         self.symbol_pairs = set()
         self.last_process_time = time.time()
 
+        # Fila de ticks: o callback do socket só enfileira; um único consumidor
+        # drena em lotes, atualiza os preços e roda a detecção uma vez por lote
+        self._tick_q: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        self._tasks: List[asyncio.Task] = []
+        # Mensagens descartadas com a fila cheia, avisadas no máximo a cada DROP_LOG_INTERVAL
+        self._dropped_ticks = 0
+        self._drop_logged_at = 0.0
+        # Último instante (monotônico) de execução de cada triângulo (pares A, B, C)
+        self._last_execution: Dict[Tuple[str, str, str], float] = {}
+
+        # Preços em float64 indexados por símbolo
+        self._sym_index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        # Linha (bid, ask, bid_qty, ask_qty) por símbolo: lida inteira, é sempre consistente
+        self._book = np.zeros((1024, 4), dtype=np.float64)
+        # Tabela de triângulos válidos (T x 3: par A, par B, par C) e o caminho de cada um
+        # (ex.: 'BTC->ETH->USDT->BTC'); refeita apenas quando o universo de símbolos muda
+        self._triangles = np.empty((0, 3), dtype=np.int64)
+        self._triangle_paths: List[str] = []
+        self._triangles_size = -1
+        self._triangle_fee_mul = BID_MUL * BID_MUL / ASK_MUL
+        # Confere uma vez, após o primeiro scan, que nenhum kernel recompilou
+        self._kernels_checked = False
+        # Lucro mínimo do modo atual (mesma unidade de profit_percentage), lido uma vez;
+        # triângulos abaixo dele são descartados antes de qualquer alocação
+        mode_config = AI_CONFIG['test_mode'] if self.test_mode else AI_CONFIG['prod_mode']
+        self._min_profit = max(float(mode_config['min_profit']), 0.0)
+        self._min_rate = 1.0 + self._min_profit / 100.0
+        # Índice invertido símbolo -> triângulos e símbolos alterados desde a última varredura
+        self._sym_to_triangles: List[np.ndarray] = []
+        self._dirty_symbols = set()
+        # Máscara (T,) dos triângulos afetados, reutilizada entre varreduras
+        self._affected_mask = np.zeros(0, dtype=np.bool_)
+        # Buckets por base: moeda restante do par -> índices dos símbolos
+        # (ex.: 'BTC' -> {'ETH': [ETHBTC], 'USDT': [BTCUSDT]}), preenchidos ao registrar
+        self._pairs_by_base: Dict[str, Dict[str, List[int]]] = {base: {} for base in BASES}
+
         # Histórico
-        self.opportunities_history = []
         self.max_history_size = 1000
-        self.history_file = os.path.join(self.data_dir, 'opportunities_history.json')
+        self.opportunities_history = collections.deque(maxlen=self.max_history_size)
+        # Journal JSONL: cada execução é anexada, sem reescrever o arquivo inteiro.
+        # Ao passar de 2x max_history_size linhas (e no encerramento) o journal é
+        # compactado para as últimas max_history_size entradas
+        self.history_file = os.path.join(self.data_dir, 'opportunities_history.jsonl')
+        # Histórico no formato JSON anterior, importado uma vez se o journal não existir
+        self.legacy_history_file = os.path.join(self.data_dir, 'opportunities_history.json')
+        self._hist_fh = None
+        self._hist_lines = 0
         self._load_history()
 
     def _load_history(self):
-        """Carrega histórico de oportunidades"""
+        """Carrega histórico de oportunidades (últimas max_history_size linhas)"""
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    self.opportunities_history = json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            self.opportunities_history.append(orjson.loads(line))
+                            self._hist_lines += 1
+                if self._hist_lines > self.max_history_size:
+                    self._compact_history()
+            elif os.path.exists(self.legacy_history_file):
+                with open(self.legacy_history_file, 'rb') as f:
+                    self.opportunities_history.extend(orjson.loads(f.read()))
+                self._compact_history()
+                self.logger.info(
+                    f"Histórico migrado de {self.legacy_history_file} ({len(self.opportunities_history)} entradas)")
         except Exception as e:
             self.logger.error(f"Erro ao carregar histórico: {e}")
-            self.opportunities_history = []
+            self.opportunities_history.clear()
+
+    def _compact_history(self):
+        """Regrava o journal apenas com as entradas em memória (últimas max_history_size)"""
+        tmp_file = self.history_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            for entry in self.opportunities_history:
+                f.write(orjson.dumps(entry) + b'\n')
+        os.replace(tmp_file, self.history_file)
+        self._hist_lines = len(self.opportunities_history)
 
     @property
     def is_connected(self) -> bool:
@@ -136,6 +240,12 @@ class BotCore:
             # Atualiza exchange no currency_core
             self.currency_core.exchange = self.connection.client
 
+            # Compila os kernels numéricos antes do primeiro tick
+            kernels.warmup()
+
+            # Abre o journal de histórico em modo append
+            self._hist_fh = open(self.history_file, 'ab')
+
             self.logger.info("✅ Bot inicializado com sucesso")
             
             if self.test_mode:
@@ -160,11 +270,19 @@ class BotCore:
                 raise ValueError("Nenhum par retornado pelo AI Pair Finder")
             
             self.symbol_pairs.update(initial_pairs)
+
+            # Pré-registra os símbolos e monta a tabela de triângulos uma única vez
+            for symbol in initial_pairs:
+                self._symbol_slot(symbol)
+            self._rebuild_triangles()
             
             # Inicia stream de mercado
             if not await self.connection.start_market_stream(initial_pairs):
                 raise ValueError("Falha ao iniciar stream de mercado")
             
+            # Consumidor único da fila de ticks
+            self._tasks.append(asyncio.create_task(self._consume_ticks()))
+
             # Processa mensagens do stream
             await self.connection.process_socket_messages(self._handle_market_data)
             
@@ -176,11 +294,57 @@ class BotCore:
     async def stop(self):
         """Para o bot"""
         self.running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
         await self._cleanup()
         self.logger.info("Bot finalizado")
 
     async def _handle_market_data(self, msg: Dict):
-        """Processa dados do mercado"""
+        """Enfileira dados do mercado para processamento em lote"""
+        try:
+            self._tick_q.put_nowait(msg)
+        except asyncio.QueueFull:
+            self._dropped_ticks += 1
+            now = time.monotonic()
+            if now - self._drop_logged_at >= DROP_LOG_INTERVAL:
+                self.logger.warning(
+                    f"Fila de ticks cheia: {self._dropped_ticks} mensagens descartadas")
+                self._dropped_ticks = 0
+                self._drop_logged_at = now
+
+    async def _consume_ticks(self):
+        """
+        Drena a fila de ticks em lotes e detecta oportunidades no máximo uma vez a cada
+        DETECT_INTERVAL; ticks recebidos nesse intervalo só atualizam o livro
+        """
+        queue = self._tick_q
+        last_detect = 0.0
+        while self.running:
+            batch = [await queue.get()]
+            while len(batch) < 256 and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            # Um único relógio por lote para o timestamp de todos os ticks
+            now = time.time()
+            for msg in batch:
+                self._apply_market_data(msg, now)
+
+            wait = last_detect + DETECT_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                # Aplica o que chegou durante a espera antes de varrer
+                now = time.time()
+                while not queue.empty():
+                    self._apply_market_data(queue.get_nowait(), now)
+
+            last_detect = time.monotonic()
+            await self._detect_opportunities()
+            self.last_process_time = time.time()
+
+    def _apply_market_data(self, msg: Dict, now: Optional[float] = None):
+        """Atualiza o cache de preços com um tick (único escritor, sem lock)"""
         try:
             if not msg or 'data' not in msg:
                 return
@@ -189,118 +353,196 @@ class BotCore:
             if data['e'] != 'bookTicker':
                 return
                 
-            # Atualiza cache de preços
-            symbol = data['s']
-            price_data = {
-                'bid': float(data['b']),
-                'ask': float(data['a']),
-                'bid_qty': float(data['B']),
-                'ask_qty': float(data['A']),
-                'timestamp': time.time()
-            }
-            
-            async with self._price_cache_lock:
-                self.price_cache[symbol] = price_data
+            symbol, bid, ask, bid_qty, ask_qty = _BOOK_TICKER_FIELDS(data)
+            bid = float(bid)
+            ask = float(ask)
+            bid_qty = float(bid_qty)
+            ask_qty = float(ask_qty)
+            if now is None:
+                now = time.time()
+
+            # Atualiza cache de preços (lido pelo web app) reaproveitando o dict do símbolo
+            entry = self.price_cache.get(symbol)
+            if entry is None:
+                self.price_cache[symbol] = {
+                    'bid': bid,
+                    'ask': ask,
+                    'bid_qty': bid_qty,
+                    'ask_qty': ask_qty,
+                    'timestamp': now
+                }
+            else:
+                entry['bid'] = bid
+                entry['ask'] = ask
+                entry['bid_qty'] = bid_qty
+                entry['ask_qty'] = ask_qty
+                entry['timestamp'] = now
 
-            # Detecta oportunidades periodicamente
-            current_time = time.time()
-            if current_time - self.last_process_time >= 0.1:  # 100ms
-                await self._detect_opportunities()
-                self.last_process_time = current_time
+            idx = self._symbol_slot(symbol)
+            self._book[idx] = (bid, ask, bid_qty, ask_qty)
+            self._dirty_symbols.add(idx)
 
         except Exception as e:
             self.logger.error(f"Erro no processamento de dados: {e}")
 
-    def _validate_opportunity_data(self, opportunity: Dict, analysis: Dict) -> Optional[Dict]:
-        """Valida e formata dados da oportunidade"""
-        try:
-            # Valida dados obrigatórios
-            if not all(k in opportunity for k in ['path', 'profit_percentage', 'volumes']):
-                self.logger.warning("Dados obrigatórios faltando na oportunidade")
-                return None
-            
-            # Formata dados
-            formatted_data = {
-                'path': opportunity['path'],
-                'profit': float(opportunity['profit_percentage']),
-                'market_metrics': {
-                    'volumes': opportunity['volumes'],
-                    'spread': opportunity.get('spread', 0),
-                    'execution_time': analysis.get('execution_time', 0),
-                    'liquidity': sum(opportunity['volumes'].values()),
-                    'risk_score': analysis.get('risk_score', 0),
-                    'volatility': analysis.get('volatility', 0),
-                    'confidence_score': analysis.get('confidence_score', 0),
-                    'slippage': analysis.get('slippage', 0)
-                },
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # Valida tipos e ranges
-            if not (isinstance(formatted_data['profit'], float) and formatted_data['profit'] >= 0):
-                self.logger.warning("Profit inválido")
-                return None
-                
-            if not formatted_data['market_metrics']['volumes']:
-                self.logger.warning("Volumes vazios")
-                return None
-                
-            return formatted_data
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao validar dados: {e}")
-            return None
+    def _symbol_slot(self, symbol: str) -> int:
+        """Retorna o índice do símbolo nos arrays de preço, alocando se necessário"""
+        idx = self._sym_index.get(symbol)
+        if idx is not None:
+            return idx
+
+        idx = len(self._symbols)
+        if idx >= self._book.shape[0]:
+            # Dobra a capacidade preservando os preços já gravados
+            grown = np.zeros((self._book.shape[0] * 2, 4), dtype=np.float64)
+            grown[:idx] = self._book[:idx]
+            self._book = grown
+
+        self._sym_index[symbol] = idx
+        self._symbols.append(symbol)
+        for base in BASES:
+            other = _strip_base(symbol, base)
+            if other:
+                self._pairs_by_base[base].setdefault(other, []).append(idx)
+        return idx
+
+    def _rebuild_triangles(self):
+        """
+        Monta a tabela de triângulos (A, B, C) onde C = A sem a base + B sem a base.
+        Cada símbolo é decomposto uma vez em prefixo/sufixo, sem testar todos os pares.
+        """
+        triangles = []
+        triangle_paths = []
+        for base in BASES:
+            by_stripped = self._pairs_by_base[base]
+            for symbol_c, i_c in self._sym_index.items():
+                for cut in range(1, len(symbol_c)):
+                    symbol_a = symbol_c[:cut]
+                    a_list = by_stripped.get(symbol_a)
+                    b_list = by_stripped.get(symbol_c[cut:]) if a_list else None
+                    if not b_list:
+                        continue
+                    # O caminho é montado aqui, uma vez por triângulo, e não a cada tick
+                    path = f"{base}->{symbol_a}->{symbol_c[cut:]}->{base}"
+                    for i_a in a_list:
+                        for i_b in b_list:
+                            if i_a != i_b:
+                                triangles.append((i_a, i_b, i_c))
+                                triangle_paths.append(path)
+
+        self._triangles = np.array(triangles, dtype=np.int64).reshape(-1, 3)
+        self._triangle_paths = triangle_paths
+        self._triangles_size = len(self._symbols)
+
+        # Índice invertido: para cada símbolo, os triângulos que o referenciam
+        flat = self._triangles.ravel()
+        owners = np.repeat(np.arange(len(triangles), dtype=np.int64), 3)
+        order = np.argsort(flat, kind='stable')
+        counts = np.bincount(flat, minlength=len(self._symbols))
+        self._sym_to_triangles = np.split(owners[order], np.cumsum(counts)[:-1])
+        self._affected_mask = np.zeros(len(triangles), dtype=np.bool_)
+
+        # Após reconstruir, todos os símbolos precisam ser reavaliados
+        self._dirty_symbols = set(range(len(self._symbols)))
 
     async def _detect_opportunities(self):
         """Detecta oportunidades de arbitragem"""
         try:
-            # Copia cache para processamento
-            async with self._price_cache_lock:
-                prices = self.price_cache.copy()
-
             opportunities = []
-            bases = ['BTC', 'ETH', 'USDT', 'BNB']
-            
-            for base in bases:
-                pairs = [p for p in prices.keys() if base in p]
-                for pair_a in pairs:
-                    for pair_b in pairs:
-                        if pair_a != pair_b:
-                            opp = self._check_arbitrage(pair_a, pair_b, base, prices)
-                            if opp:
-                                # Analisa oportunidade
-                                analysis = await self.arbitrage_analyzer.analyze_opportunity(opp)
-                                if analysis and analysis.get('confidence_score', 0) >= AI_CONFIG['min_confidence']:
-                                    # Valida e formata dados mantendo todas as métricas
-                                    opportunity_data = {
-                                        **opp,
-                                        'analysis': analysis,
-                                        'market_metrics': {
-                                            'volumes': opp['volumes'],
-                                            'spread': opp.get('spread', 0),
-                                            'execution_time': analysis.get('execution_time', 0),
-                                            'liquidity': sum(opp['volumes'].values()),
-                                            'risk_score': analysis.get('risk_score', 0),
-                                            'volatility': analysis.get('volatility', 0),
-                                            'confidence_score': analysis.get('confidence_score', 0),
-                                            'slippage': analysis.get('slippage', 0)
-                                        }
-                                    }
-                                    
-                                    # Valida estrutura dos dados
-                                    validated_data = self._validate_opportunity_data(opportunity_data, analysis)
-                                    if not validated_data:
-                                        continue
-                                    opportunities.append(opportunity_data)
-                                    
-                                    # Atualiza display com dados em tempo real
-                                    await self.display.update_opportunities([opportunity_data])
+
+            if self._triangles_size != len(self._symbols):
+                self._rebuild_triangles()
+
+            # Reavalia apenas os triângulos que contêm algum símbolo alterado
+            dirty, self._dirty_symbols = self._dirty_symbols, set()
+            if not dirty or not self._triangles.size:
+                return
+            # Marca os triângulos de cada símbolo alterado numa máscara booleana:
+            # flatnonzero já devolve os índices ordenados e sem repetição
+            sym_to_triangles = self._sym_to_triangles
+            mask = self._affected_mask
+            for i in dirty:
+                mask[sym_to_triangles[i]] = True
+            affected = np.flatnonzero(mask)
+            mask[affected] = False
+            if not affected.size:
+                return
+
+            tri = self._triangles[affected]
+            book = self._book
+            if kernels.NUMBA_AVAILABLE:
+                # Kernel compilado: taxa, comparação e extração em um único loop paralelo
+                hits = np.empty(tri.shape[0], dtype=np.int64)
+                rate = np.empty(tri.shape[0], dtype=np.float64)
+                count = kernels.scan_triangles(
+                    book, BID, ASK, tri, self._triangle_fee_mul, self._min_rate, hits, rate
+                )
+                hits = hits[:count]
+                if not self._kernels_checked:
+                    # Após o warmup, o primeiro scan real não pode ter recompilado
+                    self._kernels_checked = True
+                    recompiled = kernels.recompiled_kernels()
+                    if recompiled:
+                        self.logger.warning(f"Kernels recompilados fora do warmup: {recompiled}")
+            else:
+                bids, asks = book[:, BID], book[:, ASK]
+                ask_a = asks[tri[:, 0]]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    rate = bids[tri[:, 1]] * bids[tri[:, 2]] / ask_a * self._triangle_fee_mul
+                hits = np.flatnonzero((ask_a > 0) & (rate > self._min_rate))
+
+            # Só os sobreviventes viram dicts: preços e volumes das três pernas saem
+            # do livro numa única indexação e o lucro vem da taxa já calculada acima
+            hit_tri = tri[hits]
+            legs = book[hit_tri]
+            leg_prices = (legs[:, _LEGS, _LEG_PRICE] * _LEG_FEE_MUL).tolist()
+            leg_volumes = legs[:, _LEGS, _LEG_QTY].tolist()
+            profits = ((rate[hits] - 1.0) * 100.0).tolist()
+            paths, symbols = self._triangle_paths, self._symbols
+            ts_iso = datetime.now().isoformat()
+            for t, (i_a, i_b, i_c), prices, volumes, profit in zip(
+                affected[hits].tolist(), hit_tri.tolist(), leg_prices, leg_volumes, profits
+            ):
+                pairs = (symbols[i_a], symbols[i_b], symbols[i_c])
+                opp = {
+                    'path': paths[t],
+                    'pairs': list(pairs),
+                    'profit_percentage': profit,
+                    'timestamp': ts_iso,
+                    'prices': dict(zip(pairs, prices)),
+                    'volumes': dict(zip(pairs, volumes))
+                }
+                # Analisa oportunidade
+                analysis = await self.arbitrage_analyzer.analyze_opportunity(opp)
+                if analysis and analysis.get('confidence_score', 0) >= AI_CONFIG['min_confidence']:
+                    # Valida e formata dados mantendo todas as métricas
+                    opportunity_data = {
+                        **opp,
+                        'analysis': analysis,
+                        'market_metrics': {
+                            'volumes': opp['volumes'],
+                            'spread': opp.get('spread', 0),
+                            'execution_time': analysis.get('execution_time', 0),
+                            'liquidity': sum(opp['volumes'].values()),
+                            'risk_score': analysis.get('risk_score', 0),
+                            'volatility': analysis.get('volatility', 0),
+                            'confidence_score': analysis.get('confidence_score', 0),
+                            'slippage': analysis.get('slippage', 0)
+                        }
+                    }
+                    
+                    # Sem revalidação aqui: opp sempre traz path, volumes das três
+                    # pernas e profit_percentage float acima de _min_profit (>= 0)
+                    opportunities.append(opportunity_data)
+                    
+                    # Atualiza display com dados em tempo real
+                    await self.display.update_opportunities([opportunity_data])
 
             # Processa e exibe oportunidades
             if opportunities:
-                # Ordena por lucro
-                opportunities.sort(key=lambda x: float(x['profit_percentage']), reverse=True)
-                self.opportunities = opportunities[:10]  # Mantém top 10
+                # Top 10 por lucro sem ordenar a lista inteira
+                top = heapq.nlargest(10, opportunities, key=lambda x: x['profit_percentage'])
+                self.opportunities = top
                 self.last_update = datetime.now()
                 
                 # Atualiza display
@@ -319,62 +561,22 @@ class BotCore:
                             'confidence_score': 80  # Confiança base
                         }
                     }
-                    for opp in opportunities[:10]
+                    for opp in top
                 ])
 
-                # Executa/simula melhores oportunidades
-                for opp in opportunities[:3]:  # Processa top 3
+                # Executa/simula melhores oportunidades (top 3), cada triângulo no
+                # máximo uma vez por EXECUTION_COOLDOWN
+                now = time.monotonic()
+                for opp in top[:3]:
+                    key = tuple(opp['pairs'])
+                    if now - self._last_execution.get(key, -EXECUTION_COOLDOWN) < EXECUTION_COOLDOWN:
+                        continue
+                    self._last_execution[key] = now
                     await self._execute_opportunity(opp)
 
         except Exception as e:
             self.logger.error(f"Erro na detecção de oportunidades: {e}")
 
-    def _check_arbitrage(self, pair_a: str, pair_b: str, base: str, prices: Dict) -> Optional[Dict]:
-        """Verifica potencial de arbitragem"""
-        try:
-            # Extrai símbolos
-            symbol_a = pair_a.replace(base, '')
-            symbol_b = pair_b.replace(base, '')
-            pair_c = f"{symbol_a}{symbol_b}"
-
-            if pair_c not in prices:
-                return None
-
-            # Calcula taxas
-            fee = Decimal('0.001')  # 0.1%
-            
-            # Calcula preços considerando taxas
-            price_a = Decimal(str(prices[pair_a]['ask'])) * (1 + fee)
-            price_b = Decimal(str(prices[pair_b]['bid'])) * (1 - fee)
-            price_c = Decimal(str(prices[pair_c]['bid'])) * (1 - fee)
-
-            # Calcula lucro potencial
-            profit = (price_b * price_c / price_a - 1) * 100
-
-            if profit > 0:
-                return {
-                    'path': f"{base}->{symbol_a}->{symbol_b}->{base}",
-                    'pairs': [pair_a, pair_b, pair_c],
-                    'profit_percentage': float(profit),
-                    'timestamp': datetime.now().isoformat(),
-                    'prices': {
-                        pair_a: float(price_a),
-                        pair_b: float(price_b),
-                        pair_c: float(price_c)
-                    },
-                    'volumes': {
-                        pair_a: float(prices[pair_a]['ask_qty']),
-                        pair_b: float(prices[pair_b]['bid_qty']),
-                        pair_c: float(prices[pair_c]['bid_qty'])
-                    }
-                }
-
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Erro ao verificar arbitragem: {e}")
-            return None
-
     async def _execute_opportunity(self, opportunity: Dict):
         """Executa oportunidade de arbitragem"""
         try:
@@ -408,9 +610,14 @@ class BotCore:
             }
 
             # Atualiza histórico e display
-            if len(self.opportunities_history) >= self.max_history_size:
-                self.opportunities_history.pop(0)
             self.opportunities_history.append(execution_data)
+            if self._hist_fh:
+                self._hist_fh.write(orjson.dumps(execution_data) + b'\n')
+                self._hist_lines += 1
+                if self._hist_lines >= 2 * self.max_history_size:
+                    self._hist_fh.close()
+                    self._compact_history()
+                    self._hist_fh = open(self.history_file, 'ab')
             
             # Atualiza display em tempo real
             await self.display.update_opportunities([execution_data])
@@ -433,11 +640,11 @@ class BotCore:
             if self.currency_core:
                 await self.currency_core.close()
             
-            # Salva histórico
-            if self.opportunities_history:
-                self.logger.info("💾 Salvando histórico...")
-                with open(self.history_file, 'w') as f:
-                    json.dump(self.opportunities_history, f, indent=2)
+            # Fecha o journal de histórico e o reduz às últimas max_history_size entradas
+            if self._hist_fh:
+                self._hist_fh.close()
+                self._hist_fh = None
+                self._compact_history()
                 self.logger.info("✅ Histórico salvo com sucesso")
                 
         except Exception as e:
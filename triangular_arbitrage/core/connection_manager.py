@@ -4,8 +4,11 @@ Gerenciador de conexões para o bot
 from typing import Optional, Dict, List
 import asyncio
 import logging
+import random
+import orjson
 from binance import AsyncClient, BinanceSocketManager
 from binance.exceptions import BinanceAPIException
+from .binance_init import OrjsonSocketManager
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +39,8 @@ class ConnectionManager:
             if not self.client:
                 raise ValueError("Falha ao criar cliente Binance")
 
-            self.socket_manager = BinanceSocketManager(self.client)
+            # Frames decodificados com orjson direto no socket
+            self.socket_manager = OrjsonSocketManager(self.client)
             if not self.socket_manager:
                 raise ValueError("Falha ao criar socket manager")
 
@@ -99,12 +103,17 @@ class ConnectionManager:
         if not self.active_socket:
             return
 
+        retry_delay = 0.5
         try:
             async with self.active_socket as socket:
                 while self._running:
                     try:
                         msg = await socket.recv()
                         if msg:
+                            retry_delay = 0.5
+                            # Frames brutos são decodificados direto dos bytes, sem passar por str
+                            if isinstance(msg, (bytes, bytearray, str)):
+                                msg = orjson.loads(msg)
                             await callback(msg)
                     except asyncio.TimeoutError:
                         continue
@@ -112,7 +121,9 @@ class ConnectionManager:
                         self.logger.error(f"Erro no processamento: {e}")
                         if not self._running:
                             break
-                        await asyncio.sleep(1)
+                        # Backoff exponencial com full jitter
+                        retry_delay = min(retry_delay * 2, 30.0)
+                        await asyncio.sleep(random.uniform(0, retry_delay))
 
         except Exception as e:
             self.logger.error(f"Erro no socket: {e}")
@@ -52,6 +52,20 @@ class CurrencyCore:
         self.tickers = {}
         self.markets = {}
         self.last_update = None
+
+        # Memo da última busca dinâmica: chave de melhores ofertas -> candidatos
+        self._last_offers_key = None
+        self._last_candidates: List[Dict] = []
+
+        # Mercado (step) e posição de cada símbolo em self.markets, resolvidos
+        # no primeiro tick; os ticks seguintes só trocam o ticker naquela posição
+        self._market_slots: Dict[str, tuple] = {}
+
+        # Símbolo de conversão para BTC de cada moeda de cotação (ex: ETH -> ETHBTC)
+        self._btc_symbols: Dict[str, str] = {}
+
+        # Tasks criadas por esta instância (canceladas em stop_ticker_stream)
+        self._tasks: List[asyncio.Task] = []
         
         # Modos de operação
         self.test_mode = config.get('test_mode', True)
@@ -215,7 +229,7 @@ class CurrencyCore:
             self.logger.info(f"✅ {processed} tickers processados com sucesso")
 
             # Inicia loop de atualização
-            asyncio.create_task(self.ticker_loop())
+            self._tasks.append(asyncio.create_task(self.ticker_loop()))
 
         except Exception as e:
             self.logger.error(f"❌ Erro ao iniciar stream: {str(e)}")
@@ -330,7 +344,7 @@ class CurrencyCore:
 
             # Atualiza streams
             self.tickers[symbol] = ticker_obj
-            self.markets = self._organize_markets(list(self.tickers.values()))
+            self._place_in_market(symbol, ticker_obj)
 
             # Notifica controller se existir e tiver o método
             if self.controller is not None:
@@ -347,18 +361,22 @@ class CurrencyCore:
             if self.config.get('DEBUG', False):
                 self.logger.error(f"🔍 Detalhes: {str(e.__class__.__name__)}")
 
-    def _organize_markets(self, tickers: List[Ticker]) -> Dict:
-        """Organiza tickers por mercado base"""
-        markets = {step: [] for step in self.steps}
-
-        for ticker in tickers:
-            for base in self.steps:
-                symbol = f"{ticker.symbol.base}{ticker.symbol.quote}"
-                if symbol.endswith(base):
-                    markets[base].append(ticker)
-                    break
-
-        return markets
+    def _place_in_market(self, symbol: str, ticker: Ticker):
+        """Coloca o ticker no seu mercado base, sem reorganizar os demais"""
+        slot = self._market_slots.get(symbol)
+        if slot is None:
+            if not self.markets:
+                self.markets = {step: [] for step in self.steps}
+
+            pair = f"{ticker.symbol.base}{ticker.symbol.quote}"
+            step = next((base for base in self.steps if pair.endswith(base)), None)
+            position = -1
+            if step is not None:
+                position = len(self.markets[step])
+                self.markets[step].append(ticker)
+            self._market_slots[symbol] = (step, position)
+        elif slot[0] is not None:
+            self.markets[slot[0]][slot[1]] = ticker
 
     def get_currency_from_stream(self, stream: Dict, from_cur: str, to_cur: str) -> Optional[Ticker]:
         """Obtém taxa de câmbio entre duas moedas"""
@@ -463,24 +481,33 @@ class CurrencyCore:
         MAX_SPREAD = 0.02  # Spread máximo de 2%
 
         # Mapeia pares do mercado A com filtros
+        # O volume em BTC de cada ticker é calculado uma única vez e reaproveitado
+        # tanto no filtro quanto nos volumes do candidato
         a_keys = {}
+        a_volumes = {}
         for pair in a_pairs:
             if (pair.volume > 0 and
                 pair.bid_price > 0 and
                 pair.ask_price > 0 and
                 pair.trades >= MIN_TRADES and
-                self._normalize_volume(pair) >= MIN_VOLUME_BTC and
                     (pair.ask_price - pair.bid_price) / pair.ask_price <= MAX_SPREAD):
 
+                volume_btc = self._normalize_volume(pair)
+                if volume_btc < MIN_VOLUME_BTC:
+                    continue
+
+                # Os pares de markets[a_pair] terminam com a_pair: basta cortar o sufixo
                 symbol = f"{pair.symbol.base}{pair.symbol.quote}"
-                key = symbol.replace(a_pair, '')
+                key = symbol[:-len(a_pair)]
                 a_keys[key] = pair
+                a_volumes[key] = volume_btc
 
         # Remove par direto para evitar arbitragem de 1 passo
         if b_pair in a_keys:
             del a_keys[b_pair]
 
         matches = []
+        ts_iso = datetime.now().isoformat()
 
         # Procura matches entre os mercados com filtros aprimorados
         for b_pair_ticker in b_pairs:
@@ -489,12 +516,15 @@ class CurrencyCore:
                 b_pair_ticker.bid_price <= 0 or
                 b_pair_ticker.ask_price <= 0 or
                 b_pair_ticker.trades < MIN_TRADES or
-                self._normalize_volume(b_pair_ticker) < MIN_VOLUME_BTC or
                     (b_pair_ticker.ask_price - b_pair_ticker.bid_price) / b_pair_ticker.ask_price > MAX_SPREAD):
                 continue
 
+            b_volume = self._normalize_volume(b_pair_ticker)
+            if b_volume < MIN_VOLUME_BTC:
+                continue
+
             symbol = f"{b_pair_ticker.symbol.base}{b_pair_ticker.symbol.quote}"
-            key = symbol.replace(b_pair, '')
+            key = symbol[:-len(b_pair)]
 
             if key in a_keys:
                 # Encontrou um caminho possível
@@ -505,8 +535,12 @@ class CurrencyCore:
                     step_c.bid_price > 0 and
                     step_c.ask_price > 0 and
                     step_c.trades >= MIN_TRADES and
-                    self._normalize_volume(step_c) >= MIN_VOLUME_BTC and
                         (step_c.ask_price - step_c.bid_price) / step_c.ask_price <= MAX_SPREAD):
+                    c_volume = self._normalize_volume(step_c)
+                else:
+                    c_volume = 0.0
+
+                if c_volume >= MIN_VOLUME_BTC:
 
                     # Calcula taxas e volumes
                     a_ticker = a_keys[key]
@@ -526,11 +560,7 @@ class CurrencyCore:
                     rate = a_rate * b_rate * c_rate
 
                     # Calcula volumes em BTC
-                    volumes = [
-                        self._normalize_volume(a_ticker),
-                        self._normalize_volume(b_pair_ticker),
-                        self._normalize_volume(step_c)
-                    ]
+                    volumes = [a_volumes[key], b_volume, c_volume]
 
                     # Calcula spreads
                     spreads = [
@@ -560,7 +590,7 @@ class CurrencyCore:
                             'b_ask': b_pair_ticker.ask_price,
                             'c_bid': step_c.bid_price,
                             'c_ask': step_c.ask_price,
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': ts_iso
                         }
 
                         # Calcula lucro potencial
@@ -585,13 +615,18 @@ class CurrencyCore:
             # Usa menor entre bid_qty e ask_qty para ser conservador
             qty = min(ticker.bid_qty, ticker.ask_qty)
 
-            if ticker.symbol.quote == 'BTC':
+            quote = ticker.symbol.quote
+            if quote == 'BTC':
                 return qty
             elif ticker.symbol.base == 'BTC':
                 return qty * ticker.last_price
             else:
-                # Tenta converter para BTC via último preço conhecido
-                btc_price = self.tickers.get(f"{ticker.symbol.quote}BTC")
+                # Tenta converter para BTC via último preço conhecido; o símbolo
+                # de conversão de cada moeda de cotação é montado uma única vez
+                btc_symbol = self._btc_symbols.get(quote)
+                if btc_symbol is None:
+                    btc_symbol = self._btc_symbols[quote] = f"{quote}BTC"
+                btc_price = self.tickers.get(btc_symbol)
                 if btc_price:
                     return qty * ticker.last_price * btc_price.last_price
                 return qty * ticker.last_price  # Melhor estimativa possível
@@ -605,6 +640,14 @@ class CurrencyCore:
         if not stream or not options:
             return []
 
+        # Se nenhuma melhor oferta mudou, o grafo é o mesmo e a busca não precisa rodar
+        offers_key = tuple(
+            (symbol, t.bid_price, t.ask_price, t.bid_qty, t.ask_qty, t.volume, t.trades)
+            for symbol, t in stream.items()
+        )
+        if offers_key == self._last_offers_key:
+            return list(self._last_candidates)
+
         self.logger.debug("🔄 Iniciando busca dinâmica de oportunidades...")
 
         # Lista de moedas base para triangulação
@@ -667,27 +710,30 @@ class CurrencyCore:
             self.logger.error(f"❌ Erro na busca dinâmica: {str(e)}")
             if self.config.get('DEBUG', False):
                 self.logger.exception(e)
+            return candidates
 
-        return candidates
+        self._last_offers_key = offers_key
+        self._last_candidates = candidates
+        return list(candidates)
 
     async def stop_ticker_stream(self):
         """Para o stream de tickers"""
         try:
             self.logger.info("🔄 Parando stream de tickers...")
             
-            # Cancela a task do ticker_loop se estiver rodando
-            for task in asyncio.all_tasks():
-                if 'ticker_loop' in str(task):
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
+            # Cancela apenas as tasks criadas por esta instância (ticker_loop)
+            tasks, self._tasks = self._tasks, []
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             
             # Limpa os dados
             self.tickers.clear()
             self.markets.clear()
+            self._market_slots.clear()
             self.last_update = None
+            self._last_offers_key = None
+            self._last_candidates = []
             
             self.logger.info("✅ Stream de tickers parado com sucesso")
         except Exception as e:
@@ -738,20 +784,17 @@ class CurrencyCore:
                 {'min_profit': 0.2, 'min_volume_btc': 0.01}
             )
 
+            # candidates já vem ordenado por taxa: dicts só para o top 10
             opportunities = []
-            for c in candidates:
-                profit = (c['rate'] - 1) * 100
-                route = f"{c['a_step_from']}-{c['b_step_from']}-{c['c_step_from']}"
-                
-                opportunity = {
-                    'route': route,
-                    'profit': round(profit, 2),
+            for c in candidates[:10]:
+                opportunities.append({
+                    'route': f"{c['a_step_from']}-{c['b_step_from']}-{c['c_step_from']}",
+                    'profit': round((c['rate'] - 1) * 100, 2),
                     'volume': round(c['a_volume'], 6),
                     'timestamp': c['timestamp']
-                }
-                opportunities.append(opportunity)
+                })
 
-            return opportunities[:10]
+            return opportunities
 
         except Exception as e:
             self.logger.error(f"Erro ao obter oportunidades: {e}")
@@ -1,6 +1,5 @@
 from asyncio import (
     set_event_loop_policy,
-    WindowsSelectorEventLoopPolicy,
     get_event_loop,
     AbstractEventLoop
 )
@@ -18,12 +17,17 @@ def configure_event_loop() -> None:
     try:
         # Configura policy específica para Windows
         if platform.system() == 'Windows':
+            from asyncio import WindowsSelectorEventLoopPolicy
             set_event_loop_policy(WindowsSelectorEventLoopPolicy())
             logger.info("✅ Event loop configurado para Windows")
         else:
-            # Em sistemas Unix, podemos usar o event loop padrão
-            from asyncio import unix_events
-            logger.info("✅ Event loop padrão mantido para Unix")
+            # Em sistemas Unix, usa uvloop (libuv) quando disponível
+            try:
+                import uvloop
+                uvloop.install()
+                logger.info("✅ Event loop uvloop configurado para Unix")
+            except ImportError:
+                logger.info("✅ Event loop padrão mantido para Unix")
             
             # Configura timezone em sistemas Unix
             if hasattr(time, 'tzset'):
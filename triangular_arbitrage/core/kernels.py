@@ -0,0 +1,202 @@
+"""
+Kernels numéricos compilados com Numba para os caminhos quentes de scoring
+
+Se o Numba não estiver instalado, NUMBA_AVAILABLE fica False e os chamadores
+devem usar a implementação NumPy equivalente.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depende do ambiente
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Substituto sem compilação quando o Numba não está disponível"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def fill_pair_scores(volume_24h, price_change, spread, scores):
+    """
+    Preenche as colunas de volume, volatilidade e spread de scores (N x 4)
+    em um único loop, sem arrays temporários
+    """
+    for i in prange(volume_24h.shape[0]):
+        scores[i, 0] = min(volume_24h[i] / 1000000.0, 1.0)
+        scores[i, 1] = min(price_change[i] / 10.0, 1.0)
+        scores[i, 2] = 1.0 - min(spread[i] * 100.0, 1.0)
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def score_and_topk(scores, weights, k, out_idx, out_score):
+    """
+    Calcula o score final ponderado de cada par em out_score e grava em
+    out_idx os índices dos k maiores em ordem decrescente
+
+    Returns:
+        int: quantidade de índices válidos em out_idx
+    """
+    n = scores.shape[0]
+    for i in prange(n):
+        total = 0.0
+        for j in range(scores.shape[1]):
+            total += scores[i, j] * weights[j]
+        out_score[i] = total
+
+    # Top-k por inserção em buffer ordenado (k pequeno, tipicamente 20)
+    count = 0
+    for i in range(n):
+        value = out_score[i]
+        if count < k:
+            pos = count
+            count += 1
+        elif value > out_score[out_idx[k - 1]]:
+            pos = k - 1
+        else:
+            continue
+        while pos > 0 and out_score[out_idx[pos - 1]] < value:
+            out_idx[pos] = out_idx[pos - 1]
+            pos -= 1
+        out_idx[pos] = i
+    return count
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def scan_triangles(book, bid_col, ask_col, tri, fee_mul, threshold, out_idx, out_rate):
+    """
+    Calcula a taxa de cada triângulo (A, B, C) em out_rate e grava em out_idx
+    os índices com taxa acima de threshold
+
+    Lê bid e ask direto das linhas de book (N x 4, contíguo) em vez de receber
+    colunas fatiadas, que seriam arrays não contíguos com outra assinatura.
+    Duas passadas: a primeira, paralela, calcula as taxas; a segunda compacta
+    os índices, evitando incremento atômico entre threads.
+
+    Returns:
+        int: quantidade de índices válidos em out_idx
+    """
+    n = tri.shape[0]
+    for i in prange(n):
+        ask = book[tri[i, 0], ask_col]
+        if ask > 0.0:
+            out_rate[i] = book[tri[i, 1], bid_col] * book[tri[i, 2], bid_col] / ask * fee_mul
+        else:
+            out_rate[i] = 0.0
+
+    count = 0
+    for i in range(n):
+        if out_rate[i] > threshold:
+            out_idx[count] = i
+            count += 1
+    return count
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def scan_price_triangles(prices, threshold, out_idx, out_profit):
+    """
+    Calcula o lucro percentual (B / (A * C) - 1) * 100 de cada linha (A, B, C)
+    de prices em out_profit e grava em out_idx os índices acima de threshold
+
+    Linhas com A ou C não positivos recebem lucro 0 e nunca são selecionadas.
+
+    Returns:
+        int: quantidade de índices válidos em out_idx
+    """
+    n = prices.shape[0]
+    for i in prange(n):
+        a = prices[i, 0]
+        c = prices[i, 2]
+        if a > 0.0 and c > 0.0:
+            out_profit[i] = (prices[i, 1] / (a * c) - 1.0) * 100.0
+        else:
+            out_profit[i] = 0.0
+
+    count = 0
+    for i in range(n):
+        if out_profit[i] > threshold and prices[i, 0] > 0.0 and prices[i, 2] > 0.0:
+            out_idx[count] = i
+            count += 1
+    return count
+
+
+KERNELS = (fill_pair_scores, score_and_topk, scan_triangles, scan_price_triangles)
+
+
+def warmup():
+    """
+    Compila os kernels antecipadamente com arrays pequenos
+
+    As entradas são montadas como nos chamadores (BotCore, ArbitrageAgent e
+    AIPairFinder): mesmos dtypes, layouts e tipos escalares, para que a
+    assinatura compilada aqui seja a mesma usada no primeiro tick.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    # AIPairFinder._score_columns: colunas derivadas de operações elementares
+    volume = np.ones(2, dtype=np.float64)
+    volume_24h = volume * volume
+    spread = (volume - volume) / volume
+    price_change = np.abs(volume)
+    scores = np.empty((2, 4), dtype=np.float64)
+    fill_pair_scores(volume_24h, price_change, spread, scores)
+
+    # AIPairFinder._select_best_pairs
+    weights = np.array([0.4, 0.3, 0.2, 0.1], dtype=np.float64)
+    top_n = min(20, len(scores))
+    score_and_topk(
+        scores,
+        weights,
+        top_n,
+        np.empty(top_n, dtype=np.int64),
+        np.empty(len(scores), dtype=np.float64)
+    )
+
+    # BotCore._detect_opportunities: livro N x 4 e triângulos por indexação
+    book = np.zeros((2, 4), dtype=np.float64)
+    triangles = np.zeros((1, 3), dtype=np.int64)
+    tri = triangles[np.flatnonzero(np.ones(1, dtype=np.bool_))]
+    scan_triangles(
+        book,
+        0,
+        1,
+        tri,
+        1.0,
+        1.0,
+        np.empty(tri.shape[0], dtype=np.int64),
+        np.empty(tri.shape[0], dtype=np.float64)
+    )
+
+    # ArbitrageAgent: preços das pernas vindos de uma lista de tuplas
+    px = np.array([(1.0, 1.0, 1.0)], dtype=np.float64)
+    scan_price_triangles(
+        px,
+        0.0,
+        np.empty(px.shape[0], dtype=np.int64),
+        np.empty(px.shape[0], dtype=np.float64)
+    )
+
+
+def recompiled_kernels():
+    """
+    Lista os kernels com mais de uma assinatura compilada
+
+    Depois do warmup cada kernel deve ter exatamente uma; uma assinatura extra
+    indica que algum chamador passou dtype ou layout diferente e forçou uma
+    recompilação em tempo de execução.
+
+    Returns:
+        dict: nome do kernel -> quantidade de assinaturas
+    """
+    if not NUMBA_AVAILABLE:
+        return {}
+    return {
+        kernel.__name__: len(kernel.signatures)
+        for kernel in KERNELS
+        if len(kernel.signatures) > 1
+    }
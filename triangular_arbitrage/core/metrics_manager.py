@@ -11,29 +11,29 @@ class MetricsManager:
     def __init__(self):
         self.analysis_count = 0
         self.success_count = 0
-        self.total_response_time = 0
+        # Tempos em nanossegundos de relógio monotônico: inteiros, sem ajuste de NTP
+        self.total_response_ns = 0
         self.total_cost = 0
-        self.start_time = time.time()
+        self.start_ns = time.monotonic_ns()
 
-    def start_analysis(self):
+    def start_analysis(self) -> int:
         self.analysis_count += 1
-        return time.time()
+        return time.monotonic_ns()
 
-    def end_analysis(self, start_time, success: bool, cost: float = 0):
-        response_time = time.time() - start_time
-        self.total_response_time += response_time
+    def end_analysis(self, start_ns: int, success: bool, cost: float = 0):
+        self.total_response_ns += time.monotonic_ns() - start_ns
         self.total_cost += cost
         
         if success:
             self.success_count += 1
 
     def get_metrics(self) -> Dict:
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = (time.monotonic_ns() - self.start_ns) / 1e9
         
         success_rate = (self.success_count / self.analysis_count) * 100 \
             if self.analysis_count > 0 else 0
         
-        avg_response_time = self.total_response_time / self.analysis_count \
+        avg_response_time = self.total_response_ns / self.analysis_count / 1e9 \
             if self.analysis_count > 0 else 0
         
         return {
@@ -23,6 +23,10 @@ class TradingCore:
         self.trade_amount = Decimal(str(TRADING_CONFIG.get('min_volume_btc', '0.01')))
         self.max_slippage = Decimal(str(TRADING_CONFIG.get('max_slippage', '0.002')))
         self.fee_rate = Decimal(str(TRADING_CONFIG.get('fee_rate', '0.001')))
+        # Constantes derivadas da taxa, calculadas uma vez: fração mantida a cada
+        # operação e deslocamento do lucro líquido em % (100 + taxas das 3 operações)
+        self._fee_keep = 1 - self.fee_rate
+        self._net_profit_offset = 100 + self.fee_rate * 300
         
         # Modos de operação
         self.test_mode = TRADING_CONFIG.get('test_mode', True)
@@ -31,6 +35,8 @@ class TradingCore:
         # Controle de trades
         self.active_trades: List[Dict] = []
         self.completed_trades: List[Dict] = []
+        # Contador monotônico: ids não se repetem quando trades saem de active_trades
+        self._next_trade_id = 0
         
         # Stop loss e take profit
         self.stop_loss_pct = Decimal('0.01')  # 1% de perda máxima
@@ -159,7 +165,8 @@ class TradingCore:
             return False
 
         # Registra início do trade
-        trade_id = len(self.active_trades) + 1
+        self._next_trade_id += 1
+        trade_id = self._next_trade_id
         trade = {
             'id': trade_id,
             'start_time': datetime.now(),
@@ -225,7 +232,7 @@ class TradingCore:
                     return False
 
                 # Atualiza quantidade para próximo passo
-                current_amount = quantity * Decimal(str(rate)) * (1 - self.fee_rate)
+                current_amount = quantity * Decimal(str(rate)) * self._fee_keep
 
                 trade['steps'].append({
                     'step': i,
@@ -255,11 +262,8 @@ class TradingCore:
     async def validate_opportunity(self, opportunity: Dict) -> bool:
         """Valida se uma oportunidade pode ser executada"""
         try:
-            # Verifica lucro mínimo considerando taxas
-            profit = Decimal(str(opportunity['rate'])) - 1
-            profit = profit * 100  # Converte para porcentagem
-            total_fees = self.fee_rate * 3  # 3 operações
-            net_profit = profit - (total_fees * 100)
+            # Verifica lucro mínimo considerando taxas: (rate - 1) * 100 - taxa * 3 * 100
+            net_profit = Decimal(str(opportunity['rate'])) * 100 - self._net_profit_offset
             
             if net_profit < self.min_profit:
                 logger.debug(
@@ -5,6 +5,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from .core.bot_core import BotCore
+from .core.event_loop import configure_event_loop
 from .utils.logger import Logger
 from .utils.db_helpers import DBHelpers
 from .ui.display import Display
@@ -95,9 +96,8 @@ class ArbitrageRunner:
 
 def run():
     """Função principal para executar o sistema"""
-    # Configura event loop para Windows
-    if os.name == 'nt':
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    # Configura event loop (Windows selector / uvloop em Unix)
+    configure_event_loop()
     
     # Cria e executa runner
     runner = ArbitrageRunner()
@@ -6,6 +6,7 @@ from rich.table import Table
 from rich.live import Live
 from typing import Dict, List
 from datetime import datetime
+import heapq
 import logging
 
 class Display:
@@ -129,11 +130,11 @@ class Display:
                 return
 
             # Adiciona oportunidades ordenadas
-            sorted_opps = sorted(
+            sorted_opps = heapq.nlargest(
+                10,
                 opportunities,
-                key=lambda x: float(x.get('profit', 0)),
-                reverse=True
-            )[:10]  # Top 10
+                key=lambda x: float(x.get('profit', 0))
+            )  # Top 10
 
             for opp in sorted_opps:
                 formatted = self._format_opportunity(opp)
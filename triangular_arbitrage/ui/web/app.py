@@ -4,6 +4,7 @@ from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 import json
 import asyncio
+import heapq
 from typing import Dict, List, Optional, Union, Any
 from datetime import datetime, timedelta
 import logging
@@ -828,8 +829,8 @@ class WebDashboard:
                     }
                     pair_metrics.append(metrics)
 
-            # Ordena por lucro médio e pega os top 10
-            top_pairs = sorted(pair_metrics, key=lambda x: x['avg_profit'], reverse=True)[:10]
+            # Top 10 por lucro médio sem ordenar a lista inteira
+            top_pairs = heapq.nlargest(10, pair_metrics, key=lambda x: x['avg_profit'])
             
             await websocket.send_text(json.dumps({
                 'type': 'top_pairs_update',
@@ -1083,8 +1084,8 @@ class WebDashboard:
                             'status': 'active' if datetime.now().timestamp() - datetime.fromisoformat(last_update).timestamp() < 300 else 'inactive'
                         })
 
-                # Ordena por volume e retorna top 10
-                top_pairs = sorted(pair_metrics, key=lambda x: x['volume_24h'], reverse=True)[:10]
+                # Top 10 por volume sem ordenar a lista inteira
+                top_pairs = heapq.nlargest(10, pair_metrics, key=lambda x: x['volume_24h'])
                 
                 return {
                     'pairs': top_pairs,
@@ -55,7 +55,7 @@ class CircuitBreaker:
             self._locks[operation] = asyncio.Lock()
         return self._locks[operation]
 
-    def _should_allow_request(self) -> bool:
+    def allow_request(self) -> bool:
         """Verifica se requisição deve ser permitida baseado no estado atual"""
         current_time = time.time()
         
@@ -78,11 +78,11 @@ class CircuitBreaker:
             return True
         return False
 
-    def _handle_success(self):
-        """Processa sucesso da operação"""
+    def record_success(self):
+        """Processa sucesso da operação (zera a sequência de falhas consecutivas)"""
+        self.failure_count = 0
         if self.state == CircuitState.HALF_OPEN:
             self.state = CircuitState.CLOSED
-            self.failure_count = 0
             debug_logger.log_event(
                 'circuit_state_change',
                 f'Circuit {self.name} mudou para CLOSED',
@@ -92,8 +92,8 @@ class CircuitBreaker:
         self.metrics['successful_calls'] += 1
         self.metrics['total_calls'] += 1
 
-    def _handle_failure(self, error: Exception):
-        """Processa falha da operação"""
+    def record_failure(self, error: Exception):
+        """Processa falha da operação; abre o circuito após failure_threshold falhas consecutivas"""
         self.failure_count += 1
         self.last_failure_time = time.time()
         self.metrics['failed_calls'] += 1
@@ -137,7 +137,7 @@ def circuit_breaker(breaker: CircuitBreaker, operation: str):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            if not breaker._should_allow_request():
+            if not breaker.allow_request():
                 debug_logger.log_event(
                     'circuit_blocked',
                     f'Circuit {breaker.name} bloqueou requisição',
@@ -149,11 +149,11 @@ def circuit_breaker(breaker: CircuitBreaker, operation: str):
             async with lock:
                 try:
                     result = await func(*args, **kwargs)
-                    breaker._handle_success()
+                    breaker.record_success()
                     return result
                     
                 except Exception as e:
-                    breaker._handle_failure(e)
+                    breaker.record_failure(e)
                     debug_logger.log_event(
                         'circuit_failure',
                         f'Falha na operação {operation}',